@@ -4,14 +4,18 @@ agenkit: The foundation layer for AI agents.
 Minimal, perfect primitives for agent communication.
 """
 
-from agenkit.composition import (
-    ConditionalAgent,
-    FallbackAgent,
-    ParallelAgent,
-    SequentialAgent,
-)
+from typing import TYPE_CHECKING, Any
+
 from agenkit.interfaces import Agent, Message, Tool, ToolResult
-from agenkit.patterns import Task
+
+if TYPE_CHECKING:
+    from agenkit.composition import (
+        ConditionalAgent,
+        FallbackAgent,
+        ParallelAgent,
+        SequentialAgent,
+    )
+    from agenkit.patterns import Task
 
 __version__ = "0.1.0"
 
@@ -29,3 +33,29 @@ __all__ = [
     # Agent patterns
     "Task",
 ]
+
+# Composition and pattern classes are imported on first access (PEP 562), so
+# code that only needs the core interfaces does not pay for loading them.
+_LAZY_IMPORTS = {
+    "ConditionalAgent": "agenkit.composition",
+    "FallbackAgent": "agenkit.composition",
+    "ParallelAgent": "agenkit.composition",
+    "SequentialAgent": "agenkit.composition",
+    "Task": "agenkit.patterns",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
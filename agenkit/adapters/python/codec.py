@@ -1,16 +1,58 @@
 """Message serialization and deserialization for protocol adapter."""
 
+import contextlib
 import json
+import os
+import re
+import sys
+import time
 from datetime import datetime, timezone
+from types import ModuleType
 from typing import Any
-from uuid import uuid4
 
 from agenkit.interfaces import Message, ToolResult
 
 from .errors import InvalidMessageError, MalformedPayloadError, UnsupportedVersionError
 
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # Optional speedup, install with the "fast" extra
+    orjson = None
+
 PROTOCOL_VERSION = "1.0"
 
+# Fields every envelope must carry, in the order missing ones are reported
+_ENVELOPE_FIELDS = ("version", "type", "id", "payload")
+_REQUIRED_FIELDS = frozenset(_ENVELOPE_FIELDS)
+
+_MESSAGE_TYPES = frozenset(
+    {
+        "request",
+        "response",
+        "error",
+        "heartbeat",
+        "register",
+        "unregister",
+        "stream_chunk",
+        "stream_end",
+    }
+)
+
+# orjson options matching json.dumps behavior: non-str keys are stringified,
+# and datetimes/dataclasses are rejected rather than serialized natively.
+# orjson still serializes Enum and UUID values that json.dumps rejects.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+# orjson parses integers wider than 64 bits as floats. Any payload with a run
+# of 19 or more digits (which every such integer has) is parsed by the stdlib
+# instead, so decoding stays exact; false positives only cost speed.
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
+
 
 def encode_message(message: Message) -> dict[str, Any]:
     """Encode a Message object to a dictionary for JSON serialization.
@@ -42,9 +84,12 @@ def decode_message(data: dict[str, Any]) -> Message:
         MalformedPayloadError: If message data is invalid
     """
     try:
-        # Parse timestamp if present, otherwise use current time
+        # Parse timestamp if present, otherwise use current time. In-process
+        # callers may hand over an already-parsed datetime; skip parsing then.
         timestamp_str = data.get("timestamp", "")
-        if timestamp_str:
+        if isinstance(timestamp_str, datetime):
+            timestamp = timestamp_str
+        elif timestamp_str:
             # Handle 'Z' suffix (convert to '+00:00' for fromisoformat)
             if timestamp_str.endswith('Z'):
                 timestamp_str = timestamp_str[:-1] + '+00:00'
@@ -52,8 +97,14 @@ def decode_message(data: dict[str, Any]) -> Message:
         else:
             timestamp = datetime.now(timezone.utc)
 
+        # Roles come from a small fixed vocabulary; interning the decoded
+        # string shares one object per role across all decoded messages
+        role = data["role"]
+        if type(role) is str:
+            role = sys.intern(role)
+
         return Message(
-            role=data["role"],
+            role=role,
             content=data["content"],
             metadata=data.get("metadata", {}),
             timestamp=timestamp,
@@ -102,6 +153,37 @@ def decode_tool_result(data: dict[str, Any]) -> ToolResult:
         raise MalformedPayloadError(f"Failed to decode tool result: {e}", {"data": data}) from e
 
 
+# Envelopes created within the same millisecond share one timestamp string;
+# formatting the current time costs more than building the rest of the envelope
+_TIMESTAMP_WINDOW_NS = 1_000_000
+_timestamp_cache: tuple[int, str] = (-_TIMESTAMP_WINDOW_NS, "")
+
+
+def _envelope_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string, at most 1ms stale."""
+    global _timestamp_cache  # noqa: PLW0603
+
+    now_ns = time.monotonic_ns()
+    cached_ns, cached = _timestamp_cache
+    if now_ns - cached_ns < _TIMESTAMP_WINDOW_NS:
+        return cached
+
+    # One tuple assignment, so concurrent readers never see a torn pair
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+    _timestamp_cache = (now_ns, timestamp)
+    return timestamp
+
+
+# Maps a random hex digit onto the RFC 4122 variant digits (10xx in binary)
+_UUID_VARIANT_DIGITS = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+
+def _new_envelope_id() -> str:
+    """Return a random version 4 UUID string without building a UUID object."""
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_UUID_VARIANT_DIGITS[h[16]]}{h[17:20]}-{h[20:]}"
+
+
 def create_request_envelope(
     method: str, agent_name: str | None = None, payload: dict[str, Any] | None = None
 ) -> dict[str, Any]:
@@ -118,8 +200,8 @@ def create_request_envelope(
     return {
         "version": PROTOCOL_VERSION,
         "type": "request",
-        "id": str(uuid4()),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "id": _new_envelope_id(),
+        "timestamp": _envelope_timestamp(),
         "payload": {
             "method": method,
             **({"agent_name": agent_name} if agent_name else {}),
@@ -142,7 +224,7 @@ def create_response_envelope(request_id: str, payload: dict[str, Any]) -> dict[s
         "version": PROTOCOL_VERSION,
         "type": "response",
         "id": request_id,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _envelope_timestamp(),
         "payload": payload,
     }
 
@@ -168,7 +250,7 @@ def create_error_envelope(
         "version": PROTOCOL_VERSION,
         "type": "error",
         "id": request_id,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _envelope_timestamp(),
         "payload": {
             "error_code": error_code,
             "error_message": error_message,
@@ -191,7 +273,7 @@ def create_stream_chunk_envelope(request_id: str, message: dict[str, Any]) -> di
         "version": PROTOCOL_VERSION,
         "type": "stream_chunk",
         "id": request_id,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _envelope_timestamp(),
         "payload": {"message": message},
     }
 
@@ -209,12 +291,12 @@ def create_stream_end_envelope(request_id: str) -> dict[str, Any]:
         "version": PROTOCOL_VERSION,
         "type": "stream_end",
         "id": request_id,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _envelope_timestamp(),
         "payload": {},
     }
 
 
-def validate_envelope(envelope: dict[str, Any]) -> None:
+def validate_envelope(envelope: Any) -> None:
     """Validate a protocol envelope.
 
     Args:
@@ -224,39 +306,30 @@ def validate_envelope(envelope: dict[str, Any]) -> None:
         InvalidMessageError: If envelope is invalid
         UnsupportedVersionError: If protocol version is not supported
     """
-    # Check required fields
-    if "version" not in envelope:
-        raise InvalidMessageError("Missing 'version' field in envelope")
+    # Valid JSON need not be an object; arrays and scalars have no fields
+    if not isinstance(envelope, dict):
+        raise InvalidMessageError(
+            f"Envelope must be a JSON object, got {type(envelope).__name__}",
+            {"type": type(envelope).__name__},
+        )
+
+    # Check required fields with one set difference; on failure, report the
+    # first missing field so the error does not depend on set iteration order
+    missing = _REQUIRED_FIELDS - envelope.keys()
+    if missing:
+        field = next(name for name in _ENVELOPE_FIELDS if name in missing)
+        raise InvalidMessageError(f"Missing '{field}' field in envelope", {"field": field})
 
     if envelope["version"] != PROTOCOL_VERSION:
         raise UnsupportedVersionError(
             f"Unsupported protocol version: {envelope['version']}", {"version": envelope["version"]}
         )
 
-    if "type" not in envelope:
-        raise InvalidMessageError("Missing 'type' field in envelope")
-
-    valid_types = {
-        "request",
-        "response",
-        "error",
-        "heartbeat",
-        "register",
-        "unregister",
-        "stream_chunk",
-        "stream_end",
-    }
-    if envelope["type"] not in valid_types:
+    if envelope["type"] not in _MESSAGE_TYPES:
         raise InvalidMessageError(
             f"Invalid message type: {envelope['type']}", {"type": envelope["type"]}
         )
 
-    if "id" not in envelope:
-        raise InvalidMessageError("Missing 'id' field in envelope")
-
-    if "payload" not in envelope:
-        raise InvalidMessageError("Missing 'payload' field in envelope")
-
 
 def encode_bytes(envelope: dict[str, Any]) -> bytes:
     """Encode an envelope to bytes for transmission.
@@ -267,6 +340,18 @@ def encode_bytes(envelope: dict[str, Any]) -> bytes:
     Returns:
         UTF-8 encoded JSON bytes
     """
+    if orjson is not None:
+        try:
+            encoded: bytes = orjson.dumps(envelope, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Values orjson rejects (e.g. integers wider than 64 bits) go
+            # through the stdlib encoder, which has the final say
+            pass
+        else:
+            # orjson writes NaN and Infinity as null; output that contains
+            # null is re-encoded by the stdlib, which preserves them
+            if b"null" not in encoded:
+                return encoded
     return json.dumps(envelope).encode("utf-8")
 
 
@@ -282,8 +367,17 @@ def decode_bytes(data: bytes) -> dict[str, Any]:
     Raises:
         MalformedPayloadError: If data cannot be decoded
     """
+    decoded_data: dict[str, Any] | None = None
+    if orjson is not None and _LONG_DIGIT_RUN.search(data) is None:
+        # orjson validates UTF-8 while parsing, no separate decode pass.
+        # Input it rejects (NaN/Infinity tokens, invalid UTF-8 or JSON) is
+        # left to the stdlib, which accepts or reports it exactly as before.
+        with contextlib.suppress(orjson.JSONDecodeError):
+            decoded_data = orjson.loads(data)
+
     try:
-        decoded_data: dict[str, Any] = json.loads(data.decode("utf-8"))
+        if decoded_data is None:
+            decoded_data = json.loads(data.decode("utf-8"))
         validate_envelope(decoded_data)
         return decoded_data
     except json.JSONDecodeError as e:
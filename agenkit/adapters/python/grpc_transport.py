@@ -15,6 +15,19 @@ from .errors import ConnectionClosedError, InvalidMessageError, MalformedPayload
 from .errors import ConnectionError as ConnError
 from .transport import Transport
 
+# Suggested channel retry policy: calls that fail with UNAVAILABLE (server not
+# reachable yet, connection reset) are retried by gRPC itself with
+# exponential backoff, before the error ever reaches Python code. Retries are
+# off by default because a retried call may run a non-idempotent agent twice;
+# pass this (or a copy) as retry_policy only for agents that are safe to retry.
+UNAVAILABLE_RETRY_POLICY: dict[str, Any] = {
+    "maxAttempts": 3,
+    "initialBackoff": "0.1s",
+    "maxBackoff": "2s",
+    "backoffMultiplier": 2,
+    "retryableStatusCodes": ["UNAVAILABLE"],
+}
+
 
 class GRPCTransport(Transport):
     """gRPC transport for agent communication.
@@ -31,16 +44,22 @@ class GRPCTransport(Transport):
         >>> response = await transport.receive_framed()
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, retry_policy: dict[str, Any] | None = None):
         """Initialize gRPC transport.
 
         Args:
             url: gRPC endpoint URL (e.g., "grpc://localhost:50051")
+            retry_policy: gRPC service config retry policy applied to every
+                method on the channel, or None (the default) for no channel
+                retries. A retried process call may run the agent more than
+                once, so only enable this for idempotent agents; see
+                UNAVAILABLE_RETRY_POLICY.
 
         Raises:
             ValueError: If URL format is invalid
         """
         self._url = url
+        self._retry_policy = dict(retry_policy) if retry_policy is not None else None
         self._channel: aio.Channel | None = None
         self._stub: agent_pb2_grpc.AgentServiceStub | None = None
         self._connected = False
@@ -70,7 +89,15 @@ class GRPCTransport(Transport):
         try:
             # Create async gRPC channel
             target = f"{self._host}:{self._port}"
-            self._channel = aio.insecure_channel(target)
+            if self._retry_policy is None:
+                self._channel = aio.insecure_channel(target)
+            else:
+                service_config = {
+                    "methodConfig": [{"name": [{}], "retryPolicy": self._retry_policy}]
+                }
+                self._channel = aio.insecure_channel(
+                    target, options=[("grpc.service_config", json.dumps(service_config))]
+                )
 
             # Create stub
             self._stub = agent_pb2_grpc.AgentServiceStub(self._channel)
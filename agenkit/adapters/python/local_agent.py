@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any
 
 from websockets.asyncio.server import ServerConnection, serve
+from websockets.exceptions import ConnectionClosedOK
 
 from agenkit.interfaces import Agent
 
@@ -424,9 +425,12 @@ class LocalAgent:
         logger.debug(f"WebSocket client connected: {client_addr}")
 
         try:
-            async for message in websocket:
-                # Ensure we have bytes
-                message_bytes = message.encode('utf-8') if isinstance(message, str) else message
+            while True:
+                try:
+                    # Take text frames as raw bytes, no UTF-8 decode/re-encode
+                    message_bytes = await websocket.recv(decode=False)
+                except ConnectionClosedOK:
+                    break
 
                 # Check if this is a streaming request
                 try:
@@ -1,7 +1,9 @@
 """Remote agent client for protocol adapter."""
 
 import asyncio
+import contextlib
 from collections.abc import AsyncIterator
+from typing import Any
 
 from agenkit.interfaces import Agent, Message
 
@@ -124,24 +126,74 @@ class RemoteAgent(Agent):
                 response_bytes = await asyncio.wait_for(
                     self._transport.receive_framed(), timeout=self._timeout
                 )
-                response = decode_bytes(response_bytes)
-
-                # Handle response
-                if response["type"] == "error":
-                    error_payload = response["payload"]
-                    raise RemoteExecutionError(
-                        self._name,
-                        error_payload["error_message"],
-                        error_payload.get("error_details"),
-                    )
+                return self._decode_process_response(decode_bytes(response_bytes))
 
-                if response["type"] != "response":
-                    raise InvalidMessageError(
-                        f"Expected 'response' but got '{response['type']}'", {"response": response}
-                    )
+            except asyncio.TimeoutError as e:
+                raise AgentTimeoutError(self._name, self._timeout) from e
+            except (ConnectionError, ProtocolError):
+                # Re-raise protocol/connection errors as-is
+                raise
+            except Exception as e:
+                # Wrap unexpected errors
+                raise RemoteExecutionError(self._name, str(e)) from e
+
+    async def process_many(self, messages: list[Message]) -> list[Message]:
+        """Process several messages with pipelined requests.
+
+        On transports that support pipelining, requests are written while a
+        concurrent reader collects the responses, so the batch costs about one
+        round trip instead of one per message and cannot stall on full socket
+        buffers. Responses are matched to requests by envelope id and returned
+        in request order. If the batch fails part-way, the connection is closed
+        so unread responses cannot leak into later requests. Other transports
+        fall back to sequential process() calls.
+
+        Args:
+            messages: Input messages
+
+        Returns:
+            Response messages, one per input message
+
+        Raises:
+            ConnectionError: If connection fails
+            AgentTimeoutError: If request times out
+            RemoteExecutionError: If remote agent raises an error
+            ProtocolError: If protocol error occurs
+        """
+        if not self._transport.supports_pipelining:
+            return [await self.process(message) for message in messages]
+
+        await self._ensure_connected()
 
-                # Decode and return message
-                return decode_message(response["payload"]["message"])
+        requests = [
+            create_request_envelope(
+                method="process",
+                agent_name=self._name,
+                payload={"message": encode_message(message)},
+            )
+            for message in messages
+        ]
+
+        # Hold the lock for the whole batch so other requests cannot interleave
+        async with self._lock:
+            try:
+                frames = await self._exchange_frames([encode_bytes(r) for r in requests])
+
+                # Match responses to requests by id rather than trusting arrival order
+                responses: dict[str, dict[str, Any]] = {}
+                for frame in frames:
+                    response = decode_bytes(frame)
+                    responses[response["id"]] = response
+
+                results: list[Message] = []
+                for request in requests:
+                    if request["id"] not in responses:
+                        raise InvalidMessageError(
+                            f"No response for request '{request['id']}'",
+                            {"request_id": request["id"]},
+                        )
+                    results.append(self._decode_process_response(responses[request["id"]]))
+                return results
 
             except asyncio.TimeoutError as e:
                 raise AgentTimeoutError(self._name, self._timeout) from e
@@ -152,6 +204,78 @@ class RemoteAgent(Agent):
                 # Wrap unexpected errors
                 raise RemoteExecutionError(self._name, str(e)) from e
 
+    async def _exchange_frames(self, frames: list[bytes]) -> list[bytes]:
+        """Send frames while concurrently reading one response per frame.
+
+        The server answers each request before reading the next one, so
+        writing the whole batch before reading would deadlock once both
+        directions' socket buffers fill up.
+
+        Args:
+            frames: Encoded request frames
+
+        Returns:
+            Response frames in arrival order
+        """
+
+        async def write_all() -> None:
+            for frame in frames:
+                await asyncio.wait_for(self._transport.send_framed(frame), timeout=self._timeout)
+
+        async def read_all() -> list[bytes]:
+            # Read every response before decoding so an error response
+            # does not leave unread frames on the connection
+            return [
+                await asyncio.wait_for(self._transport.receive_framed(), timeout=self._timeout)
+                for _ in frames
+            ]
+
+        writer = asyncio.create_task(write_all())
+        reader = asyncio.create_task(read_all())
+        try:
+            await asyncio.gather(writer, reader)
+        except BaseException:
+            writer.cancel()
+            reader.cancel()
+            await asyncio.gather(writer, reader, return_exceptions=True)
+            # The connection may hold partial frames or late responses, so drop
+            # it and let the next request reconnect
+            self._connected = False
+            with contextlib.suppress(Exception):
+                await self._transport.close()
+            raise
+        return reader.result()
+
+    def _decode_process_response(self, response: dict[str, Any]) -> Message:
+        """Decode a response envelope for a process request.
+
+        Args:
+            response: Decoded response envelope
+
+        Returns:
+            Decoded response message
+
+        Raises:
+            RemoteExecutionError: If the response is an error
+            InvalidMessageError: If the response has an unexpected type
+        """
+        # Handle response
+        if response["type"] == "error":
+            error_payload = response["payload"]
+            raise RemoteExecutionError(
+                self._name,
+                error_payload["error_message"],
+                error_payload.get("error_details"),
+            )
+
+        if response["type"] != "response":
+            raise InvalidMessageError(
+                f"Expected 'response' but got '{response['type']}'", {"response": response}
+            )
+
+        # Decode and return message
+        return decode_message(response["payload"]["message"])
+
     async def stream(self, message: Message) -> AsyncIterator[Message]:
         """Stream responses from remote agent.
 
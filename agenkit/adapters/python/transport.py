@@ -13,6 +13,11 @@ MAX_MESSAGE_SIZE = 10 * 1024 * 1024  # 10 MB
 class Transport(ABC):
     """Abstract transport layer for agent communication."""
 
+    # Whether several framed requests can be sent before their responses are
+    # read. Off by default; transports opt in once their server is known to
+    # answer every pipelined request on the connection.
+    supports_pipelining: bool = False
+
     @abstractmethod
     async def connect(self) -> None:
         """Establish connection.
@@ -124,6 +129,9 @@ class Transport(ABC):
 class UnixSocketTransport(Transport):
     """Unix domain socket transport."""
 
+    # LocalAgent answers each request on a connection before reading the next
+    supports_pipelining = True
+
     def __init__(self, socket_path: str):
         """Initialize Unix socket transport.
 
@@ -234,6 +242,9 @@ class UnixSocketTransport(Transport):
 class TCPTransport(Transport):
     """TCP socket transport."""
 
+    # LocalAgent answers each request on a connection before reading the next
+    supports_pipelining = True
+
     def __init__(self, host: str, port: int):
         """Initialize TCP transport.
 
@@ -24,6 +24,9 @@ class WebSocketTransport(Transport):
     Includes ping/pong keepalive mechanism.
     """
 
+    # LocalAgent answers each request on a connection before reading the next
+    supports_pipelining = True
+
     def __init__(
         self,
         url: str,
@@ -153,11 +156,10 @@ class WebSocketTransport(Transport):
 
         assert self._websocket is not None
         try:
-            message = await self._websocket.recv()
-            # Ensure we return bytes (message could be str if server sends text)
-            if isinstance(message, str):
-                return message.encode('utf-8')
-            return message
+            # Protocol frames are JSON bytes: take text frames as raw bytes too,
+            # skipping the UTF-8 decode/re-encode round trip (the envelope
+            # decoder validates UTF-8 anyway)
+            return await self._websocket.recv(decode=False)
         except ConnectionClosed as e:
             self._connected = False
             self._websocket = None
@@ -28,7 +28,7 @@ __all__ = ["Agent", "Message", "Tool", "ToolResult"]
 # ============================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     """
     Universal message format for agent communication.
@@ -0,0 +1,50 @@
+"""Benchmark envelope serialization.
+
+Measures encode_bytes/decode_bytes with the stdlib json backend and with
+orjson (installed by the "fast" extra), so a regression in the fast path
+shows up as the two groups converging.
+"""
+
+import pytest
+
+from agenkit import Message
+from agenkit.adapters.python import codec
+from agenkit.adapters.python.codec import (
+    create_request_envelope,
+    decode_bytes,
+    encode_bytes,
+    encode_message,
+)
+
+
+@pytest.fixture(params=["json", "orjson"])
+def codec_backend(request, monkeypatch):
+    """Select the JSON backend used by the codec."""
+    if request.param == "json":
+        monkeypatch.setattr(codec, "orjson", None)
+    elif codec.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def request_envelope():
+    """Typical request envelope carrying one small message."""
+    message = Message(role="user", content="x" * 100, metadata={"trace_id": "abc123"})
+    return create_request_envelope("process", "agent", {"message": encode_message(message)})
+
+
+@pytest.mark.benchmark(group="codec-encode")
+def test_encode_bytes(benchmark, codec_backend, request_envelope):
+    """Encode an envelope to bytes."""
+    result = benchmark(encode_bytes, request_envelope)
+    assert result
+
+
+@pytest.mark.benchmark(group="codec-decode")
+def test_decode_bytes(benchmark, codec_backend, request_envelope):
+    """Decode (and validate) envelope bytes."""
+    data = encode_bytes(request_envelope)
+
+    result = benchmark(decode_bytes, data)
+    assert result["id"] == request_envelope["id"]
@@ -554,7 +554,7 @@ def ab_test_routing(rollout_percentage: float):
         user_id = message.metadata.get("user_id", "anonymous")
 
         # Consistent hashing for same user
-        hash_value = int(hashlib.md5(user_id.encode()).hexdigest(), 16)
+        hash_value = int.from_bytes(hashlib.md5(user_id.encode()).digest(), "big")
         percentage = (hash_value % 100) / 100.0
 
         return percentage < rollout_percentage
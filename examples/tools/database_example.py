@@ -650,10 +650,10 @@ class CachedDatabaseTool:
         self.cache = {}  # {cache_key: (result, timestamp)}
         self.stats = {"queries": 0, "cache_hits": 0, "cache_misses": 0}
 
-    def _cache_key(self, sql: str, params: tuple) -> str:
-        """Generate cache key from SQL and parameters."""
+    def _cache_key(self, sql: str, params: tuple) -> bytes:
+        """Generate cache key from SQL and parameters (raw 16-byte digest)."""
         key_str = f"{sql}:{params}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+        return hashlib.md5(key_str.encode()).digest()
 
     async def query(self, sql: str, params: tuple = ()) -> List[Dict]:
         """Execute query with caching."""
@@ -44,18 +44,25 @@ TRADE-OFFS:
 """
 
 import asyncio
+import contextlib
+import itertools
 import os
 import subprocess
 import shutil
+import signal
+import stat
 import tempfile
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import AsyncIterator, List, Dict, Optional, Union, Any
 from dataclasses import dataclass
 import hashlib
 import json
 from agenkit import Agent
 from agenkit.tools import Tool, ToolRegistry
 
+# Per-process counter for unique temp file names used by atomic writes
+_tmp_counter = itertools.count()
+
 
 # ============================================================================
 # EXAMPLE 1: File System Operations
@@ -104,9 +111,9 @@ class FileSystemTool:
         except Exception:
             return False
 
-    async def read_file(self, file_path: str) -> Dict[str, Any]:
+    def _read_file_sync(self, file_path: str) -> Dict[str, Any]:
         """
-        Read file contents.
+        Read file contents (blocking).
 
         Security: Path validation, size limits, allowed extensions.
         """
@@ -157,6 +164,30 @@ class FileSystemTool:
                 "error": f"Failed to read file: {e}"
             }
 
+    async def read_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Read file contents.
+
+        Security: Path validation, size limits, allowed extensions.
+        """
+        return self._read_file_sync(file_path)
+
+    async def read_many(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read several files in one batch.
+
+        WHY: Coding agents often read many small files at once (sources,
+        configs, tests). All reads run in a single worker-thread hop, so the
+        event loop pays one executor round trip instead of one per file and
+        is never blocked by disk I/O.
+
+        Returns:
+            One read_file-style result per path, in the same order
+        """
+        return await asyncio.to_thread(
+            lambda: [self._read_file_sync(p) for p in file_paths]
+        )
+
     async def write_file(
         self,
         file_path: str,
@@ -183,11 +214,21 @@ class FileSystemTool:
                 "error": f"File exists and overwrite=False: {file_path}"
             }
 
+        # Atomic write: write to a unique temp file, then rename. The pid and
+        # a per-process counter make the name unique per call (id(content)
+        # can repeat once an object is freed), and exclusive creation ("x")
+        # guarantees we never clobber a concurrent writer's temp file.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{next(_tmp_counter):x}.tmp")
+        created = False
         try:
-            # Atomic write: write to temp file, then rename
-            temp_path = path.with_suffix(path.suffix + '.tmp')
-            temp_path.write_text(content, encoding='utf-8')
-            temp_path.replace(path)
+            # New files get the default permissions (0o666 minus the umask)
+            with tmp_path.open('x', encoding='utf-8') as f:
+                created = True
+                f.write(content)
+            # An overwritten file keeps its permissions
+            with contextlib.suppress(FileNotFoundError):
+                tmp_path.chmod(stat.S_IMODE(path.stat().st_mode))
+            tmp_path.replace(path)
 
             return {
                 "success": True,
@@ -195,6 +236,11 @@ class FileSystemTool:
                 "size": len(content)
             }
         except Exception as e:
+            # Only remove a temp file this call created; after FileExistsError
+            # the path belongs to another writer
+            if created:
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink()
             return {
                 "success": False,
                 "error": f"Failed to write file: {e}"
@@ -290,6 +336,15 @@ async def example1_file_operations():
         result = await fs_tool.read_file(f"{temp_dir}/hello.txt")
         print(f"✓ Content: {result['content']}")
 
+        # Read several files in one batch
+        print("\n--- Reading files in a batch ---")
+        results = await fs_tool.read_many([
+            f"{temp_dir}/hello.txt",
+            f"{temp_dir}/missing.txt"
+        ])
+        for r in results:
+            print(f"  {'✓' if r['success'] else '✗'} {r.get('path') or r['error']}")
+
         # List directory
         print("\n--- Listing directory ---")
         result = await fs_tool.list_directory(temp_dir)
@@ -310,6 +365,88 @@ async def example1_file_operations():
 # EXAMPLE 2: Shell Command Execution
 # ============================================================================
 
+# Exit statuses that mean "no match" rather than failure
+_NO_MATCH_RETURNCODES = {"grep": 1}
+
+
+async def chain_subprocess(
+    commands: List[List[str]],
+    cwd: Optional[Union[str, Path]] = None,
+    chunk_size: int = 64 * 1024
+) -> AsyncIterator[bytes]:
+    """
+    Run commands as a pipeline (cmd1 | cmd2 | ...) without a shell.
+
+    Each stage's stdout is connected directly to the next stage's stdin
+    with an OS pipe, so intermediate bytes never pass through Python; only
+    the last stage's output is read and yielded in chunks.
+
+    Every stage is waited on once the output is drained. If a stage failed,
+    CalledProcessError is raised for the first failing stage, carrying its
+    captured stderr. Neither an upstream stage killed by SIGPIPE (the
+    downstream stage stopped reading) nor grep finding no match counts as
+    a failure.
+
+    Args:
+        commands: Pipeline stages, each an argv list
+        cwd: Working directory for every stage
+        chunk_size: Maximum bytes per yielded chunk
+
+    Raises:
+        subprocess.CalledProcessError: If a stage exits with a failure status
+    """
+    processes: List[asyncio.subprocess.Process] = []
+    stderr_tasks: List[asyncio.Task] = []
+    # The first stage reads nothing instead of inheriting our stdin
+    stdin: Optional[int] = subprocess.DEVNULL
+    try:
+        for i, command in enumerate(commands):
+            is_last = i == len(commands) - 1
+            read_fd, write_fd = (None, None) if is_last else os.pipe()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdin=stdin,
+                    stdout=subprocess.PIPE if is_last else write_fd,
+                    stderr=subprocess.PIPE,
+                    cwd=cwd
+                )
+            except BaseException:
+                if read_fd is not None:
+                    os.close(read_fd)
+                raise
+            finally:
+                # Only the children hold pipe ends, so EOF and SIGPIPE propagate
+                if stdin != subprocess.DEVNULL:
+                    os.close(stdin)
+                if write_fd is not None:
+                    os.close(write_fd)
+            processes.append(process)
+            # Drain stderr concurrently so a chatty stage cannot block on a full pipe
+            stderr_tasks.append(asyncio.create_task(process.stderr.read()))
+            stdin = read_fd
+
+        output = processes[-1].stdout
+        while chunk := await output.read(chunk_size):
+            yield chunk
+
+        for i, (command, process) in enumerate(zip(commands, processes)):
+            returncode = await process.wait()
+            stderr = await stderr_tasks[i]
+            if returncode == 0 or returncode == _NO_MATCH_RETURNCODES.get(command[0]):
+                continue
+            if returncode == -signal.SIGPIPE and i < len(processes) - 1:
+                continue
+            raise subprocess.CalledProcessError(returncode, command, stderr=stderr)
+    finally:
+        for process in processes:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+        for task in stderr_tasks:
+            task.cancel()
+
+
 class ShellTool:
     """
     Shell command execution with security controls.
@@ -385,21 +522,27 @@ class ShellTool:
                     process.communicate(),
                     timeout=self.timeout_seconds
                 )
-
-                return {
-                    "success": process.returncode == 0,
-                    "returncode": process.returncode,
-                    "stdout": stdout.decode('utf-8') if stdout else "",
-                    "stderr": stderr.decode('utf-8') if stderr else "",
-                    "command": " ".join(command)
-                }
             except asyncio.TimeoutError:
                 process.kill()
+                await process.wait()
                 return {
                     "success": False,
                     "error": f"Command timed out after {self.timeout_seconds}s",
                     "command": " ".join(command)
                 }
+            except asyncio.CancelledError:
+                # Don't leave the child running when the caller gives up
+                process.kill()
+                await asyncio.shield(process.wait())
+                raise
+
+            return {
+                "success": process.returncode == 0,
+                "returncode": process.returncode,
+                "stdout": stdout.decode('utf-8') if stdout else "",
+                "stderr": stderr.decode('utf-8') if stderr else "",
+                "command": " ".join(command)
+            }
         except FileNotFoundError:
             return {
                 "success": False,
@@ -413,6 +556,75 @@ class ShellTool:
                 "command": " ".join(command)
             }
 
+    async def execute_pipeline(self, commands: List[List[str]]) -> Dict[str, Any]:
+        """
+        Execute a pipeline of commands (cmd1 | cmd2 | ...) with security controls.
+
+        Every stage must pass the whitelist. Stages are connected with OS
+        pipes rather than shell syntax, so there is still no injection risk
+        and intermediate output is never copied through Python.
+
+        Args:
+            commands: Pipeline stages (e.g., [['git', 'ls-files'], ['grep', 'py']])
+        """
+        if not commands or not all(commands):
+            return {
+                "success": False,
+                "error": "Empty command"
+            }
+
+        pipeline = " | ".join(" ".join(command) for command in commands)
+
+        # Security: Check every stage is in whitelist
+        for command in commands:
+            if command[0] not in self.allowed_commands:
+                return {
+                    "success": False,
+                    "error": f"Command not allowed: {command[0]}. Allowed: {self.allowed_commands}",
+                    "command": pipeline
+                }
+
+        async def collect() -> bytes:
+            chunks = [
+                chunk async for chunk in chain_subprocess(commands, self.working_directory)
+            ]
+            return b"".join(chunks)
+
+        try:
+            stdout = await asyncio.wait_for(collect(), timeout=self.timeout_seconds)
+            return {
+                "success": True,
+                "returncode": 0,
+                "stdout": stdout.decode('utf-8'),
+                "command": pipeline
+            }
+        except subprocess.CalledProcessError as e:
+            return {
+                "success": False,
+                "returncode": e.returncode,
+                "stderr": e.stderr.decode('utf-8') if e.stderr else "",
+                "error": f"Command failed with exit code {e.returncode}: {' '.join(e.cmd)}",
+                "command": pipeline
+            }
+        except asyncio.TimeoutError:
+            return {
+                "success": False,
+                "error": f"Command timed out after {self.timeout_seconds}s",
+                "command": pipeline
+            }
+        except FileNotFoundError as e:
+            return {
+                "success": False,
+                "error": f"Command not found: {e.filename}",
+                "command": pipeline
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Command execution failed: {e}",
+                "command": pipeline
+            }
+
 
 async def example2_shell_commands():
     """
@@ -477,7 +689,7 @@ class GitTool:
     def __init__(self, repo_path: str):
         self.repo_path = Path(repo_path).resolve()
         self.shell = ShellTool(
-            allowed_commands=['git'],
+            allowed_commands=['git', 'grep'],
             working_directory=str(self.repo_path),
             timeout_seconds=30
         )
@@ -492,6 +704,25 @@ class GitTool:
             }
         return result
 
+    async def changed_files(self, pattern: Optional[str] = None) -> Dict[str, Any]:
+        """
+        List modified and untracked files, optionally filtered by regex.
+
+        Runs `git ls-files --modified --others --exclude-standard | grep -E`
+        as a pipeline, so the file list flows between processes directly.
+        """
+        commands = [['git', 'ls-files', '--modified', '--others', '--exclude-standard']]
+        if pattern:
+            commands.append(['grep', '-E', pattern])
+
+        result = await self.shell.execute_pipeline(commands)
+        if result['success']:
+            return {
+                "success": True,
+                "files": result['stdout'].splitlines()
+            }
+        return result
+
     async def diff(self, file_path: Optional[str] = None) -> Dict[str, Any]:
         """Get git diff."""
         cmd = ['git', 'diff']
@@ -562,6 +793,16 @@ async def example3_git_operations():
         result = await git_tool.commit("Initial commit")
         print(f"✓ Committed: {result['success']}")
 
+        # Find modified Python files (git ls-files | grep pipeline)
+        print("\n--- Modified Python Files ---")
+        test_file.write_text("print('hello, world')")
+        (Path(temp_dir) / "notes.txt").write_text("todo")
+        result = await git_tool.changed_files(r"\.py$")
+        if result['success']:
+            print(f"✓ Modified: {result['files']}")
+        else:
+            print(f"✗ {result['error']}: {result.get('stderr', '').strip()}")
+
         # Check branches
         print("\n--- List Branches ---")
         result = await git_tool.branch_list()
@@ -32,25 +32,84 @@ TRADE-OFFS:
 - Reliability: Depends on external service availability
 - Privacy: Queries sent to third-party services
 
+REQUIREMENTS:
+- numpy (vectorized embedding math in the semantic search example)
+- orjson (optional, faster parsing of JSON API responses)
+
 """
 
 import asyncio
+import functools
 import hashlib
+import json
+import logging
+import re
 import time
-from typing import List, Dict, Optional, Literal
+from collections import OrderedDict, deque
+from typing import (
+    Any, AsyncIterator, Callable, List, Dict, Optional, Literal, Sequence, Tuple
+)
 from dataclasses import dataclass
 import httpx
+import numpy as np
 from agenkit import Agent
 from agenkit.tools import Tool, ToolRegistry
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+logger = logging.getLogger(__name__)
+
+
+def _loads(response: httpx.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    return _json_loads(response.content)
+
+
+# ============================================================================
+# SHARED HTTP CLIENT
+# ============================================================================
+
+class _Shared:
+    """
+    One pooled client for every search tool: keep-alive connections skip the
+    TCP + TLS handshake on all but the first request to each host.
+    """
+    client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared connection-pooled HTTP client, creating it on first use."""
+    if _Shared.client is None or _Shared.client.is_closed:
+        _Shared.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=15.0
+            ),
+            timeout=30.0
+        )
+    return _Shared.client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (call once on shutdown)."""
+    client, _Shared.client = _Shared.client, None
+    if client is not None:
+        await client.aclose()
+
 
 # ============================================================================
 # MOCK SEARCH SERVICE (Replace with real API in production)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
-    """A single search result."""
+    """A single search result (immutable, no per-instance __dict__)."""
     title: str
     url: str
     snippet: str
@@ -58,6 +117,39 @@ class SearchResult:
     relevance_score: float = 0.0
 
 
+@dataclass(slots=True)
+class SearchResultBatch:
+    """
+    A batch of search results in struct-of-arrays layout.
+
+    Parallel columns instead of one object per result: ranking works on
+    the scores array directly, and only the final formatting step builds
+    per-result dicts for the agent.
+    """
+    titles: List[str]
+    urls: List[str]
+    snippets: List[str]
+    scores: np.ndarray
+    source: str = "web"
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def to_dicts(self, indices: Optional[Sequence[int]] = None) -> List[Dict[str, str]]:
+        """Format results (optionally a subset, in order) as title/url/snippet dicts."""
+        if indices is None:
+            return [
+                {"title": title, "url": url, "snippet": snippet}
+                for title, url, snippet in zip(
+                    self.titles, self.urls, self.snippets, strict=True
+                )
+            ]
+        return [
+            {"title": self.titles[i], "url": self.urls[i], "snippet": self.snippets[i]}
+            for i in indices
+        ]
+
+
 class MockSearchService:
     """
     Mock search service for demonstration.
@@ -70,26 +162,63 @@ class MockSearchService:
     - Algolia
     """
 
-    def __init__(self, latency_ms: int = 200):
+    # Query-independent parts of the mock results, built once
+    MAX_RESULTS = 5
+    _URLS = tuple(f"https://example.com/{i}" for i in range(1, MAX_RESULTS + 1))
+    _SCORES = 1.0 - np.arange(MAX_RESULTS) * 0.1
+    _SCORES.setflags(write=False)
+
+    def __init__(
+        self,
+        latency_ms: int = 200,
+        api_key: Optional[str] = None,
+        endpoint: str = "https://api.example.com/search",
+        client: Optional[httpx.AsyncClient] = None
+    ):
         self.latency_ms = latency_ms
+        self.api_key = api_key
+        self.endpoint = endpoint
+        self.client = client or get_client()
         self.call_count = 0
 
-    async def search(self, query: str, max_results: int = 10) -> List[SearchResult]:
-        """Simulate search API call."""
-        await asyncio.sleep(self.latency_ms / 1000)
+    async def search(self, query: str, max_results: int = 10) -> SearchResultBatch:
+        """Simulate search API call (or call the real API when api_key is set)."""
+        if self.api_key:
+            # Production path: reuse pooled keep-alive connections
+            response = await self.client.get(
+                self.endpoint,
+                params={"q": query, "count": max_results},
+                headers={"Authorization": f"Bearer {self.api_key}"}
+            )
+            response.raise_for_status()
+            self.call_count += 1
+            items = _loads(response)["results"]
+            return SearchResultBatch(
+                titles=[item["title"] for item in items],
+                urls=[item["url"] for item in items],
+                snippets=[item["snippet"] for item in items],
+                scores=np.fromiter(
+                    (item.get("relevance_score", 0.0) for item in items),
+                    dtype=np.float64,
+                    count=len(items)
+                )
+            )
+
+        # Zero latency (tests/benchmarks) skips the event-loop round trip
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
         self.call_count += 1
 
-        # Mock results based on query
-        return [
-            SearchResult(
-                title=f"Result {i+1} for '{query}'",
-                url=f"https://example.com/{i+1}",
-                snippet=f"This is a relevant snippet about {query}...",
-                source="web",
-                relevance_score=1.0 - (i * 0.1)
-            )
-            for i in range(min(max_results, 5))
-        ]
+        # Mock results based on query: format the query once, vary only the index
+        count = min(max_results, self.MAX_RESULTS)
+        title_suffix = f" for '{query}'"
+        return SearchResultBatch(
+            titles=[f"Result {i}{title_suffix}" for i in range(1, count + 1)],
+            urls=list(self._URLS[:count]),
+            snippets=[f"This is a relevant snippet about {query}..."] * count,
+            scores=self._SCORES[:count],
+            source="web"
+        )
 
 
 # ============================================================================
@@ -104,9 +233,14 @@ class WebSearchTool:
     Search tools bridge the knowledge gap between training cutoff and present.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         self.api_key = api_key
-        self.service = MockSearchService()
+        self.client = client or get_client()
+        self.service = MockSearchService(api_key=api_key, client=self.client)
 
     async def search(
         self,
@@ -125,14 +259,7 @@ class WebSearchTool:
         """
         results = await self.service.search(query, max_results)
 
-        return [
-            {
-                "title": r.title,
-                "url": r.url,
-                "snippet": r.snippet
-            }
-            for r in results
-        ]
+        return results.to_dicts()
 
 
 # ============================================================================
@@ -150,9 +277,7 @@ async def example1_basic_search():
     - Pros: Access to current information, source attribution
     - Cons: 200ms+ latency, depends on external service
     """
-    print("\n" + "="*80)
-    print("EXAMPLE 1: Basic Web Search")
-    print("="*80)
+    print("\n" + "="*80 + "\nEXAMPLE 1: Basic Web Search\n" + "="*80)
 
     # Create search tool
     search_tool = WebSearchTool()
@@ -218,61 +343,65 @@ class MultiSourceSearchTool:
     Search multiple sources in parallel.
 
     WHY: Different sources provide different perspectives and coverage.
-    Parallel execution reduces latency.
+    Parallel execution reduces latency, and streaming each source as it
+    completes lets callers start on fast sources while slow ones finish.
     """
 
-    def __init__(self):
-        self.web_search = MockSearchService(latency_ms=200)
-        self.news_search = MockSearchService(latency_ms=150)
-        self.academic_search = MockSearchService(latency_ms=300)
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client or get_client()
+        self.services = {
+            "web": MockSearchService(latency_ms=200, client=self.client),
+            "news": MockSearchService(latency_ms=150, client=self.client),
+            "academic": MockSearchService(latency_ms=300, client=self.client),
+        }
+
+    async def _search_source(
+        self,
+        name: str,
+        service: MockSearchService,
+        query: str,
+        max_results: int
+    ) -> Tuple[str, List[Dict[str, str]]]:
+        """Search a single source and format its results."""
+        results = await service.search(query, max_results)
+        return name, results.to_dicts()
 
     async def search_all(
         self,
         query: str,
         max_results_per_source: int = 5
-    ) -> Dict[str, List[Dict[str, str]]]:
+    ) -> AsyncIterator[Tuple[str, List[Dict[str, str]]]]:
         """
-        Search multiple sources in parallel.
+        Search multiple sources in parallel, yielding each as it completes.
+
+        Collect everything with:
+            {name: results async for name, results in tool.search_all(query)}
 
         TRADE-OFFS:
-        - Latency: max(sources) = 300ms vs sum(sources) = 650ms
+        - Latency: max(sources) = 300ms vs sum(sources) = 650ms, and the
+          first source is available after min(sources) = 150ms
         - Coverage: 3× results but 3× cost
         - Reliability: Partial results if one source fails
         """
         # Search all sources concurrently
-        web_task = self.web_search.search(query, max_results_per_source)
-        news_task = self.news_search.search(query, max_results_per_source)
-        academic_task = self.academic_search.search(query, max_results_per_source)
-
-        web_results, news_results, academic_results = await asyncio.gather(
-            web_task,
-            news_task,
-            academic_task,
-            return_exceptions=True  # Don't fail if one source fails
-        )
-
-        # Handle failures gracefully
-        results = {}
-
-        if not isinstance(web_results, Exception):
-            results["web"] = [
-                {"title": r.title, "url": r.url, "snippet": r.snippet}
-                for r in web_results
-            ]
-
-        if not isinstance(news_results, Exception):
-            results["news"] = [
-                {"title": r.title, "url": r.url, "snippet": r.snippet}
-                for r in news_results
-            ]
-
-        if not isinstance(academic_results, Exception):
-            results["academic"] = [
-                {"title": r.title, "url": r.url, "snippet": r.snippet}
-                for r in academic_results
-            ]
+        tasks = [
+            asyncio.create_task(
+                self._search_source(name, service, query, max_results_per_source)
+            )
+            for name, service in self.services.items()
+        ]
 
-        return results
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except Exception as e:
+                    # Don't fail if one source fails
+                    logger.warning("Search source failed: %s", e)
+        finally:
+            # Stop outstanding searches if the caller stops consuming early
+            for task in tasks:
+                task.cancel()
 
 
 async def example2_multi_source_search():
@@ -287,19 +416,22 @@ async def example2_multi_source_search():
     - Latency = max(sources) when parallel (300ms vs 650ms sequential)
     - Graceful degradation if one source fails
     """
-    print("\n" + "="*80)
-    print("EXAMPLE 2: Multi-Source Search (Parallel)")
-    print("="*80)
+    print("\n" + "="*80 + "\nEXAMPLE 2: Multi-Source Search (Parallel)\n" + "="*80)
 
     search_tool = MultiSourceSearchTool()
 
     query = "climate change solutions 2025"
     print(f"\nQuery: {query}")
 
-    # Measure parallel execution time
-    start = time.time()
-    results = await search_tool.search_all(query, max_results_per_source=3)
-    elapsed = time.time() - start
+    # Measure parallel execution time, noting when each source arrives
+    start = time.monotonic()
+    results = {}
+    async for source, source_results in search_tool.search_all(
+        query, max_results_per_source=3
+    ):
+        print(f"  ↳ {source} arrived after {(time.monotonic() - start)*1000:.0f}ms")
+        results[source] = source_results
+    elapsed = time.monotonic() - start
 
     print(f"\n✓ Retrieved results from {len(results)} sources in {elapsed*1000:.0f}ms")
 
@@ -318,6 +450,32 @@ async def example2_multi_source_search():
 # EXAMPLE 3: Search with Ranking and Filtering
 # ============================================================================
 
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Return indices of the k highest scores, best first.
+
+    Uses np.partition (linear time) to find the k-th highest score before
+    sorting only the selected k. Ties are broken by index, both at the
+    cutoff and in the output, so equal scores keep their original order.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        cutoff = -np.partition(-scores, k - 1)[k - 1]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)[: k - len(above)]
+        top = np.concatenate((above, tied))
+    else:
+        top = np.arange(len(scores))
+    return top[np.lexsort((top, -scores[top]))]
+
+
+@functools.lru_cache(maxsize=128)
+def _domain_pattern(domains: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile (once per domain set) a regex matching any of the domains."""
+    return re.compile("|".join(map(re.escape, domains)))
+
+
 class RankedSearchTool:
     """
     Search with result ranking and filtering.
@@ -326,8 +484,9 @@ class RankedSearchTool:
     Ranking and filtering improve result quality.
     """
 
-    def __init__(self):
-        self.service = MockSearchService()
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client or get_client()
+        self.service = MockSearchService(client=self.client)
 
     async def search_ranked(
         self,
@@ -350,29 +509,35 @@ class RankedSearchTool:
         """
         # Get raw results
         results = await self.service.search(query, max_results * 2)
+        if not results:
+            return []
 
-        # Filter by relevance
-        filtered = [r for r in results if r.relevance_score >= min_relevance]
+        # Filter by relevance (on a copy; the batch itself is never mutated)
+        keep = np.flatnonzero(results.scores >= min_relevance)
+        scores = results.scores[keep]
 
         # Boost preferred domains
         if preferred_domains:
-            for result in filtered:
-                for domain in preferred_domains:
-                    if domain in result.url:
-                        result.relevance_score *= 1.5
+            # One C-level scan per URL instead of a Python loop over domains
+            matches_domain = _domain_pattern(tuple(preferred_domains)).search
+            boost = np.fromiter(
+                (matches_domain(results.urls[i]) is not None for i in keep),
+                dtype=bool,
+                count=len(keep)
+            )
+            scores = np.where(boost, scores * 1.5, scores)
 
-        # Sort by relevance
-        filtered.sort(key=lambda r: r.relevance_score, reverse=True)
+        # Select and sort the top results
+        top = _top_k(scores, max_results)
 
-        # Return top results
         return [
             {
-                "title": r.title,
-                "url": r.url,
-                "snippet": r.snippet,
-                "relevance": r.relevance_score
+                "title": results.titles[keep[i]],
+                "url": results.urls[keep[i]],
+                "snippet": results.snippets[keep[i]],
+                "relevance": float(scores[i])
             }
-            for r in filtered[:max_results]
+            for i in top
         ]
 
 
@@ -388,9 +553,7 @@ async def example3_ranked_search():
     - Latency: Ranking adds ~10-50ms processing overhead
     - Complexity: More configuration options for users
     """
-    print("\n" + "="*80)
-    print("EXAMPLE 3: Search with Ranking and Filtering")
-    print("="*80)
+    print("\n" + "="*80 + "\nEXAMPLE 3: Search with Ranking and Filtering\n" + "="*80)
 
     search_tool = RankedSearchTool()
 
@@ -421,6 +584,22 @@ async def example3_ranked_search():
 # EXAMPLE 4: Semantic Search
 # ============================================================================
 
+
+@functools.lru_cache(maxsize=8192)
+def _embed(text: str) -> np.ndarray:
+    """
+    Compute (and memoize) a mock text embedding.
+
+    Repeated queries and overlapping result snippets hit the cache instead
+    of re-hashing. The returned array is read-only because it is shared.
+    """
+    # Mock embedding (hash-based for demo): 16 digest bytes -> 16-dim vector
+    digest = hashlib.md5(text.encode(), usedforsecurity=False).digest()
+    embedding = np.frombuffer(digest, dtype=np.uint8).astype(np.float32) / 255.0
+    embedding.setflags(write=False)
+    return embedding
+
+
 class SemanticSearchTool:
     """
     Semantic search using embeddings.
@@ -429,30 +608,20 @@ class SemanticSearchTool:
     Embeddings capture meaning for better retrieval.
     """
 
-    def __init__(self):
-        self.service = MockSearchService()
-        # In production, use real embeddings (OpenAI, Cohere, etc.)
-        self.cache = {}
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client or get_client()
+        self.service = MockSearchService(client=self.client)
 
-    def _compute_embedding(self, text: str) -> List[float]:
+    def _compute_embedding(self, text: str) -> np.ndarray:
         """
         Compute text embedding.
 
-        In production, use:
+        In production, use (and cache) real embeddings:
         - OpenAI embeddings (text-embedding-3-small)
         - Cohere embeddings
         - Sentence transformers
         """
-        # Mock embedding (hash-based for demo)
-        hash_val = int(hashlib.md5(text.encode()).hexdigest(), 16)
-        return [float((hash_val >> i) & 0xFF) / 255.0 for i in range(0, 128, 8)]
-
-    def _cosine_similarity(self, a: List[float], b: List[float]) -> float:
-        """Compute cosine similarity between embeddings."""
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(y * y for y in b) ** 0.5
-        return dot_product / (norm_a * norm_b) if norm_a and norm_b else 0.0
+        return _embed(text)
 
     async def search_semantic(
         self,
@@ -468,34 +637,38 @@ class SemanticSearchTool:
         - Higher latency (~100ms for embedding + search)
         - Higher cost (embedding API + storage)
         """
-        # Compute query embedding
+        # Compute query embedding (normalized once)
         query_embedding = self._compute_embedding(query)
+        query_embedding = query_embedding / (np.linalg.norm(query_embedding) + 1e-12)
 
         # Get candidate results
         results = await self.service.search(query, max_results * 2)
+        if not results:
+            return []
 
-        # Compute similarity scores
-        scored_results = []
-        for result in results:
-            # Compute embedding for result
-            result_text = f"{result.title} {result.snippet}"
-            result_embedding = self._compute_embedding(result_text)
+        # Embed all candidates into one contiguous (N, D) matrix
+        embeddings = np.stack([
+            self._compute_embedding(f"{title} {snippet}")
+            for title, snippet in zip(results.titles, results.snippets, strict=True)
+        ])
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
 
-            # Compute similarity
-            similarity = self._cosine_similarity(query_embedding, result_embedding)
+        # Compute all similarity scores with a single matrix-vector product
+        similarities = embeddings @ query_embedding
 
-            if similarity >= min_similarity:
-                scored_results.append({
-                    "title": result.title,
-                    "url": result.url,
-                    "snippet": result.snippet,
-                    "similarity": similarity
-                })
+        # Rank by similarity, then apply the threshold
+        top = _top_k(similarities, max_results)
+        top = top[similarities[top] >= min_similarity]
 
-        # Sort by similarity
-        scored_results.sort(key=lambda r: r["similarity"], reverse=True)
-
-        return scored_results[:max_results]
+        return [
+            {
+                "title": results.titles[i],
+                "url": results.urls[i],
+                "snippet": results.snippets[i],
+                "similarity": float(similarities[i])
+            }
+            for i in top
+        ]
 
 
 async def example4_semantic_search():
@@ -510,9 +683,7 @@ async def example4_semantic_search():
     - Higher latency: ~100ms for embedding generation
     - Higher cost: Embedding API fees (~$0.10/1M tokens)
     """
-    print("\n" + "="*80)
-    print("EXAMPLE 4: Semantic Search")
-    print("="*80)
+    print("\n" + "="*80 + "\nEXAMPLE 4: Semantic Search\n" + "="*80)
 
     search_tool = SemanticSearchTool()
 
@@ -540,18 +711,120 @@ async def example4_semantic_search():
 # EXAMPLE 5: Search with Fallback
 # ============================================================================
 
+_WORD_RE = re.compile(r"\w+")
+
+
+def _normalize_query(query: str) -> str:
+    """Reduce a query to its lowercase words, dropping punctuation and spacing."""
+    return " ".join(_WORD_RE.findall(query.casefold()))
+
+
 class ResilientSearchTool:
     """
     Search with fallback sources for high availability.
 
     WHY: External search APIs may fail or be rate-limited.
     Fallbacks ensure reliable service.
+
+    Fresh results live in a bounded LRU cache with TTL expiration. Expired
+    or evicted entries stay in a separate bounded LRU stale cache, which
+    is served only as a last resort when every source fails.
+
+    In front of the primary sits a normalized-query cache: a query that
+    differs from an earlier one only in case, whitespace or punctuation
+    reuses its results ("Machine learning tutorials!" ≈ "machine learning
+    tutorials"). Similarity over the mock hash embeddings would be noise,
+    so only near-identical queries are matched.
+
+    Requests are hedged: if the primary has not answered within
+    hedge_delay_ms, the secondary is started too and the first success wins.
     """
 
-    def __init__(self):
-        self.primary = MockSearchService(latency_ms=200)
-        self.secondary = MockSearchService(latency_ms=300)
-        self.cache = {}
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        max_cache_size: int = 1024,
+        cache_ttl: float = 300.0,
+        normalized_cache_size: int = 512,
+        hedge_delay_ms: float = 250
+    ):
+        self.client = client or get_client()
+        self.primary = MockSearchService(latency_ms=200, client=self.client)
+        self.secondary = MockSearchService(latency_ms=300, client=self.client)
+        self.hedge_delay_ms = hedge_delay_ms
+        self.max_cache_size = max_cache_size
+        self.cache_ttl = cache_ttl
+        # key -> (expires_at, results)
+        self.cache: OrderedDict = OrderedDict()
+        # key -> results (no expiry)
+        self.stale_cache: OrderedDict = OrderedDict()
+
+        # normalized query -> (expires_at, max_results, results); size 0 disables
+        self.normalized_cache_size = normalized_cache_size
+        self.normalized_cache: OrderedDict = OrderedDict()
+
+    def _normalized_get(
+        self,
+        normalized: str,
+        max_results: int
+    ) -> Optional[List[Dict[str, str]]]:
+        """Return results cached for an equivalent query, if still usable."""
+        entry = self.normalized_cache.get(normalized)
+        if entry is None:
+            return None
+
+        expires_at, fetched, results = entry
+        if time.monotonic() >= expires_at:
+            del self.normalized_cache[normalized]
+            return None
+        # Entries only serve requests for no more results than they fetched
+        if fetched < max_results:
+            return None
+
+        self.normalized_cache.move_to_end(normalized)
+        return results[:max_results]
+
+    def _normalized_put(
+        self,
+        normalized: str,
+        max_results: int,
+        results: List[Dict[str, str]]
+    ) -> None:
+        """Add an entry to the normalized-query cache, evicting LRU when full."""
+        if self.normalized_cache_size <= 0:
+            return
+        self.normalized_cache[normalized] = (
+            time.monotonic() + self.cache_ttl, max_results, results
+        )
+        self.normalized_cache.move_to_end(normalized)
+        if len(self.normalized_cache) > self.normalized_cache_size:
+            self.normalized_cache.popitem(last=False)
+
+    def _cache_get(self, cache_key) -> Optional[List[Dict[str, str]]]:
+        """Return fresh cached results, evicting the entry if expired."""
+        entry = self.cache.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, results = entry
+        if time.monotonic() >= expires_at:
+            del self.cache[cache_key]
+            return None
+
+        # Mark as recently used
+        self.cache.move_to_end(cache_key)
+        return results
+
+    def _cache_put(self, cache_key, results: List[Dict[str, str]]) -> None:
+        """Store results in both caches, evicting LRU entries when full."""
+        for cache, value in (
+            (self.cache, (time.monotonic() + self.cache_ttl, results)),
+            (self.stale_cache, results),
+        ):
+            cache[cache_key] = value
+            cache.move_to_end(cache_key)
+            if len(cache) > self.max_cache_size:
+                cache.popitem(last=False)
 
     async def search_with_fallback(
         self,
@@ -559,82 +832,110 @@ class ResilientSearchTool:
         max_results: int = 10
     ) -> Dict[str, any]:
         """
-        Search with fallback to secondary source.
+        Search with a hedged fallback to the secondary source.
 
         TRADE-OFFS:
         - Higher availability (99.9% vs 99%)
-        - Slower on primary failure (200ms + 300ms)
+        - Slow primary costs hedge delay + secondary (250ms + 300ms), not
+          the full primary timeout
+        - Extra API calls when both sources are in flight
         - More complex error handling
         """
-        # Check cache first
-        cache_key = hashlib.md5(f"{query}:{max_results}".encode()).hexdigest()
-        if cache_key in self.cache:
+        # Check cache first (tuples hash natively; no digest needed for dict keys)
+        cache_key = (query, max_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
             return {
-                "results": self.cache[cache_key],
+                "results": cached,
                 "source": "cache",
                 "latency_ms": 0
             }
 
-        # Try primary search
-        start = time.time()
+        # Then look for an earlier query differing only in case/punctuation
+        normalized = _normalize_query(query)
+        equivalent = self._normalized_get(normalized, max_results)
+        if equivalent is not None:
+            return {
+                "results": equivalent,
+                "source": "normalized_cache",
+                "latency_ms": 0
+            }
+
+        start = time.monotonic()
+
+        # Start the primary, giving it a head start before hedging
+        primary_task = asyncio.create_task(
+            asyncio.wait_for(self.primary.search(query, max_results), timeout=2.0)
+        )
+        names = {primary_task: "primary"}
+        secondary_started = False
+        winner = None
+
         try:
-            results = await asyncio.wait_for(
-                self.primary.search(query, max_results),
-                timeout=2.0
+            done, pending = await asyncio.wait(
+                {primary_task}, timeout=self.hedge_delay_ms / 1000
             )
-            latency = (time.time() - start) * 1000
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        break
+                    print(f"   ⚠ {names[task].capitalize()} search failed: {task.exception()}")
+                if winner is not None:
+                    break
+
+                # Primary failed or is slow: race the secondary against it
+                if not secondary_started:
+                    secondary_task = asyncio.create_task(
+                        asyncio.wait_for(self.secondary.search(query, max_results), timeout=3.0)
+                    )
+                    names[secondary_task] = "secondary"
+                    pending.add(secondary_task)
+                    secondary_started = True
+
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            # Cancel whichever source lost the race
+            for task in names:
+                if not task.done():
+                    task.cancel()
 
-            # Cache results
-            result_dicts = [
-                {"title": r.title, "url": r.url, "snippet": r.snippet}
-                for r in results
-            ]
-            self.cache[cache_key] = result_dicts
+        latency = (time.monotonic() - start) * 1000
+
+        if winner is not None:
+            source = names[winner]
+            result_dicts = winner.result().to_dicts()
+
+            # Cache primary results
+            if source == "primary":
+                self._cache_put(cache_key, result_dicts)
+                self._normalized_put(normalized, max_results, result_dicts)
 
             return {
                 "results": result_dicts,
-                "source": "primary",
+                "source": source,
                 "latency_ms": latency
             }
-        except Exception as e:
-            print(f"   ⚠ Primary search failed: {e}")
 
-            # Fallback to secondary
-            try:
-                results = await asyncio.wait_for(
-                    self.secondary.search(query, max_results),
-                    timeout=3.0
-                )
-                latency = (time.time() - start) * 1000
-
-                result_dicts = [
-                    {"title": r.title, "url": r.url, "snippet": r.snippet}
-                    for r in results
-                ]
-
-                return {
-                    "results": result_dicts,
-                    "source": "secondary",
-                    "latency_ms": latency
-                }
-            except Exception as e2:
-                print(f"   ⚠ Secondary search failed: {e2}")
-
-                # Return cached results if available
-                if cache_key in self.cache:
-                    return {
-                        "results": self.cache[cache_key],
-                        "source": "stale_cache",
-                        "latency_ms": (time.time() - start) * 1000
-                    }
+        # Return stale cached results if available
+        if cache_key in self.stale_cache:
+            return {
+                "results": self.stale_cache[cache_key],
+                "source": "stale_cache",
+                "latency_ms": latency
+            }
 
-                # No results available
-                return {
-                    "results": [],
-                    "source": "none",
-                    "latency_ms": (time.time() - start) * 1000,
-                    "error": "All search sources failed"
-                }
+        # No results available
+        return {
+            "results": [],
+            "source": "none",
+            "latency_ms": latency,
+            "error": "All search sources failed"
+        }
 
 
 async def example5_search_with_fallback():
@@ -649,9 +950,7 @@ async def example5_search_with_fallback():
     - Slower on failure: 200ms (primary) + 300ms (secondary) = 500ms
     - Stale data risk: Cache may be outdated
     """
-    print("\n" + "="*80)
-    print("EXAMPLE 5: Search with Fallback")
-    print("="*80)
+    print("\n" + "="*80 + "\nEXAMPLE 5: Search with Fallback\n" + "="*80)
 
     search_tool = ResilientSearchTool()
 
@@ -674,6 +973,14 @@ async def example5_search_with_fallback():
     print(f"✓ Latency: {result['latency_ms']:.0f}ms")
     print(f"✓ Results: {len(result['results'])}")
 
+    # Same query up to case and punctuation (normalized cache hit)
+    print("\n--- Third Search: 'Machine Learning tutorials?' (normalized cache hit) ---")
+    result = await search_tool.search_with_fallback("Machine Learning tutorials?", max_results=3)
+
+    print(f"✓ Source: {result['source']}")
+    print(f"✓ Latency: {result['latency_ms']:.0f}ms")
+    print(f"✓ Results: {len(result['results'])}")
+
     print("\n💡 KEY INSIGHT:")
     print("   Fallback chain: Primary → Secondary → Cache → Error")
     print("   Cache provides instant results (0ms) for repeated queries")
@@ -692,10 +999,15 @@ class RateLimitedSearchTool:
     Rate limiting prevents quota exhaustion and API bans.
     """
 
-    def __init__(self, max_calls_per_minute: int = 10):
-        self.service = MockSearchService()
+    def __init__(
+        self,
+        max_calls_per_minute: int = 10,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        self.client = client or get_client()
+        self.service = MockSearchService(client=self.client)
         self.max_calls = max_calls_per_minute
-        self.call_timestamps = []
+        self.call_timestamps: deque = deque(maxlen=max_calls_per_minute + 1)
 
     async def search_rate_limited(
         self,
@@ -710,13 +1022,11 @@ class RateLimitedSearchTool:
         - May reject requests during high traffic
         - Adds ~1ms overhead for rate limit check
         """
-        now = time.time()
+        now = time.monotonic()
 
-        # Remove old timestamps (outside window)
-        self.call_timestamps = [
-            ts for ts in self.call_timestamps
-            if now - ts < 60  # Keep last minute
-        ]
+        # Remove old timestamps (outside window); oldest are always at the left
+        while self.call_timestamps and now - self.call_timestamps[0] >= 60:
+            self.call_timestamps.popleft()
 
         # Check rate limit
         if len(self.call_timestamps) >= self.max_calls:
@@ -735,10 +1045,7 @@ class RateLimitedSearchTool:
         results = await self.service.search(query, max_results)
 
         return {
-            "results": [
-                {"title": r.title, "url": r.url, "snippet": r.snippet}
-                for r in results
-            ],
+            "results": results.to_dicts(),
             "calls_remaining": self.max_calls - len(self.call_timestamps)
         }
 
@@ -755,9 +1062,7 @@ async def example6_rate_limited_search():
     - May reject requests during traffic spikes
     - Minimal overhead (~1ms per request)
     """
-    print("\n" + "="*80)
-    print("EXAMPLE 6: Rate-Limited Search")
-    print("="*80)
+    print("\n" + "="*80 + "\nEXAMPLE 6: Rate-Limited Search\n" + "="*80)
 
     search_tool = RateLimitedSearchTool(max_calls_per_minute=5)
 
@@ -786,6 +1091,51 @@ async def example6_rate_limited_search():
 # EXAMPLE 7: Error Handling
 # ============================================================================
 
+# Error-response builders. They are plain, fully typed functions with no
+# awaits, so they can be compiled ahead of time (e.g. with mypyc) if this
+# path ever becomes CPU-bound.
+
+def _build_timeout_error() -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": "Search request timed out",
+        "error_type": "timeout_error"
+    }
+
+
+def _build_rate_limit_error(response: httpx.Response) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": "Rate limit exceeded",
+        "error_type": "rate_limit_error",
+        "retry_after": response.headers.get("Retry-After")
+    }
+
+
+def _build_auth_error(response: httpx.Response) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": "Invalid API key",
+        "error_type": "auth_error"
+    }
+
+
+def _build_http_error(response: httpx.Response) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": f"HTTP error: {response.status_code}",
+        "error_type": "http_error"
+    }
+
+
+# Maps HTTP status codes to error responses. Statuses not listed here fall
+# back to a generic "http_error" response.
+_STATUS_HANDLERS: Dict[int, Callable[[httpx.Response], Dict[str, Any]]] = {
+    429: _build_rate_limit_error,
+    401: _build_auth_error,
+}
+
+
 async def example7_error_handling():
     """
     Demonstrate comprehensive error handling for search tools.
@@ -800,14 +1150,46 @@ async def example7_error_handling():
     - User experience: Detailed errors vs generic messages
     - Debugging: Logging vs privacy
     """
-    print("\n" + "="*80)
-    print("EXAMPLE 7: Error Handling")
-    print("="*80)
+    print("\n" + "="*80 + "\nEXAMPLE 7: Error Handling\n" + "="*80)
 
     class ErrorHandlingSearchTool:
         """Search tool with comprehensive error handling."""
 
-        async def search(self, query: str) -> Dict[str, any]:
+        def __init__(
+            self,
+            client: Optional[httpx.AsyncClient] = None,
+            cache_ttl: float = 60.0,
+            max_cache_size: int = 256,
+            max_concurrency: int = 64
+        ):
+            # Reuse one client (and its keep-alive pool) for every call
+            self._owns_client = client is None
+            self._client = client or httpx.AsyncClient(
+                timeout=5.0,
+                limits=httpx.Limits(
+                    max_connections=max_concurrency, max_keepalive_connections=32
+                )
+            )
+            # Cap in-flight requests at the pool size so bursts queue here
+            # instead of thrashing the pool or tripping upstream rate limits
+            self._sem = asyncio.Semaphore(max_concurrency)
+            # Successful responses only: normalized query -> (stored_at, result)
+            self._cache: OrderedDict = OrderedDict()
+            self._ttl = cache_ttl
+            self._max_cache_size = max_cache_size
+
+        async def aclose(self) -> None:
+            """Close the HTTP client if this tool created it."""
+            if self._owns_client:
+                await self._client.aclose()
+
+        async def __aenter__(self) -> "ErrorHandlingSearchTool":
+            return self
+
+        async def __aexit__(self, *exc_info) -> None:
+            await self.aclose()
+
+        async def search(self, query: str) -> Dict[str, Any]:
             """Search with error handling."""
             try:
                 # Validate input
@@ -818,46 +1200,39 @@ async def example7_error_handling():
                         "error_type": "validation_error"
                     }
 
-                # Simulate API call
-                async with httpx.AsyncClient() as client:
-                    try:
-                        response = await client.get(
+                # Duplicate queries are answered from cache
+                key = query.strip().lower()
+                cached = self._cache.get(key)
+                if cached is not None:
+                    stored_at, result = cached
+                    if time.monotonic() - stored_at < self._ttl:
+                        self._cache.move_to_end(key)
+                        return result
+                    del self._cache[key]
+
+                # Simulate API call (pooled client, no per-call setup)
+                try:
+                    async with self._sem:
+                        response = await self._client.get(
                             "https://api.example.com/search",
                             params={"q": query},
                             timeout=5.0
                         )
-                        response.raise_for_status()
-
-                        return {
-                            "success": True,
-                            "results": response.json()
-                        }
-                    except httpx.TimeoutException:
-                        return {
-                            "success": False,
-                            "error": "Search request timed out",
-                            "error_type": "timeout_error"
-                        }
-                    except httpx.HTTPStatusError as e:
-                        if e.response.status_code == 429:
-                            return {
-                                "success": False,
-                                "error": "Rate limit exceeded",
-                                "error_type": "rate_limit_error",
-                                "retry_after": e.response.headers.get("Retry-After")
-                            }
-                        elif e.response.status_code == 401:
-                            return {
-                                "success": False,
-                                "error": "Invalid API key",
-                                "error_type": "auth_error"
-                            }
-                        else:
-                            return {
-                                "success": False,
-                                "error": f"HTTP error: {e.response.status_code}",
-                                "error_type": "http_error"
-                            }
+                    response.raise_for_status()
+
+                    result = {
+                        "success": True,
+                        "results": _loads(response)
+                    }
+                    self._cache[key] = (time.monotonic(), result)
+                    if len(self._cache) > self._max_cache_size:
+                        self._cache.popitem(last=False)
+                    return result
+                except httpx.TimeoutException:
+                    return _build_timeout_error()
+                except httpx.HTTPStatusError as e:
+                    handler = _STATUS_HANDLERS.get(e.response.status_code, _build_http_error)
+                    return handler(e.response)
             except Exception as e:
                 # Catch-all for unexpected errors
                 return {
@@ -866,8 +1241,6 @@ async def example7_error_handling():
                     "error_type": "unknown_error"
                 }
 
-    search_tool = ErrorHandlingSearchTool()
-
     # Test various error scenarios
     test_cases = [
         ("valid query", "This would succeed in production"),
@@ -877,12 +1250,17 @@ async def example7_error_handling():
     ]
 
     print("\nTesting error handling:")
-    for query, description in test_cases:
-        result = await search_tool.search(query)
-        status = "✓" if result.get("success") else "✗"
-        error_type = result.get("error_type", "none")
-        print(f"\n  {status} {description}")
-        print(f"     Error type: {error_type}")
+    async with ErrorHandlingSearchTool() as search_tool:
+        # Cases are independent: run them concurrently over the shared pool
+        results = await asyncio.gather(
+            *(search_tool.search(query) for query, _ in test_cases)
+        )
+
+        for (_query, description), result in zip(test_cases, results, strict=True):
+            status = "✓" if result.get("success") else "✗"
+            error_type = result.get("error_type", "none")
+            print(f"\n  {status} {description}")
+            print(f"     Error type: {error_type}")
 
     print("\n💡 KEY INSIGHT:")
     print("   Comprehensive error handling improves reliability:")
@@ -900,9 +1278,7 @@ async def example7_error_handling():
 async def main():
     """Run all search tool examples."""
 
-    print("\n" + "="*80)
-    print("SEARCH TOOL EXAMPLES FOR AGENKIT")
-    print("="*80)
+    print("\n" + "="*80 + "\nSEARCH TOOL EXAMPLES FOR AGENKIT\n" + "="*80)
     print("\nThese examples demonstrate WHY and HOW to use search tools with agents.")
     print("Each example includes real-world scenarios, trade-offs, and key insights.")
 
@@ -916,17 +1292,17 @@ async def main():
         ("Error Handling", example7_error_handling),
     ]
 
-    for i, (name, example_func) in enumerate(examples, 1):
-        await example_func()
+    try:
+        for i, (_name, example_func) in enumerate(examples, 1):
+            await example_func()
 
-        if i < len(examples):
-            input("\nPress Enter to continue to next example...")
+            if i < len(examples):
+                input("\nPress Enter to continue to next example...")
+    finally:
+        await close_client()
 
     # Summary
-    print("\n" + "="*80)
-    print("KEY TAKEAWAYS")
-    print("="*80)
-    print("""
+    print("\n" + "="*80 + "\nKEY TAKEAWAYS\n" + "="*80 + """
 1. WHEN TO USE SEARCH TOOLS:
    - Current information beyond LLM training data
    - Fact-checking and source attribution
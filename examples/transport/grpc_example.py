@@ -59,9 +59,12 @@ Use **TCP/Unix Sockets** when:
 """
 
 import asyncio
+import functools
+import sys
 import time
 from agenkit import Agent, Message
 from agenkit.adapters.python import GRPCServer, GRPCTransport, RemoteAgent
+from agenkit.adapters.python.grpc_transport import UNAVAILABLE_RETRY_POLICY
 
 
 class EchoAgent(Agent):
@@ -80,6 +83,12 @@ class EchoAgent(Agent):
         )
 
 
+@functools.lru_cache(maxsize=128)
+def _tokenize(text: str) -> tuple[str, ...]:
+    """Split text into words, memoized for repeated inputs."""
+    return tuple(text.split())
+
+
 class StreamingEchoAgent(Agent):
     """Echo agent that streams response word-by-word."""
 
@@ -95,14 +104,26 @@ class StreamingEchoAgent(Agent):
         )
 
     async def stream(self, message: Message):
-        """Stream the echo word by word."""
-        words = str(message.content).split()
+        """Stream the echo word by word.
+
+        Each word is due at a fixed deadline ``start + (i + 1) * 0.1`` rather
+        than after a fresh 0.1s sleep, so time spent by a slow consumer counts
+        toward the cadence instead of adding to it.
+        """
+        raw = message.content if isinstance(message.content, str) else str(message.content)
+        words = _tokenize(raw)
+        total = len(words)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
         for i, word in enumerate(words):
-            await asyncio.sleep(0.1)  # Simulate processing delay
+            # Simulate processing delay; skip the sleep if already late
+            delay = start + (i + 1) * 0.1 - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
             yield Message(
                 role="agent",
                 content=word,
-                metadata={"word_index": i, "total_words": len(words)}
+                metadata={"word_index": i, "total_words": total}
             )
 
 
@@ -115,77 +136,66 @@ class MetadataAgent(Agent):
 
     async def process(self, message: Message) -> Message:
         """Process message and include metadata in response."""
-        metadata = message.metadata or {}
+        raw = message.content if isinstance(message.content, str) else str(message.content)
 
-        # Add response metadata
+        # Echo the user metadata flat, with the agent's keys taking precedence
         response_metadata = {
+            **(message.metadata or {}),
             "received_at": time.time(),
-            "message_length": len(str(message.content)),
-            "user_metadata": metadata,
+            "message_length": len(raw),
             "processed_by": self.name
         }
 
         return Message(
             role="agent",
-            content=f"Processed: {message.content}",
+            content=f"Processed: {raw}",
             metadata=response_metadata
         )
 
 
-async def scenario_1_basic_communication():
+# The agents are stateless, so every scenario reuses the same instances
+_ECHO = EchoAgent()
+_STREAM = StreamingEchoAgent()
+_META = MetadataAgent()
+
+
+async def scenario_1_basic_communication(transport: GRPCTransport):
     """Scenario 1: Basic gRPC Communication.
 
     WHY: Demonstrate the simplest gRPC usage pattern - unary RPC where
     the client sends a single request and receives a single response.
     This is the foundation of gRPC communication.
-    """
-    print("=" * 70)
-    print("SCENARIO 1: Basic gRPC Communication")
-    print("=" * 70)
-    print()
-    print("Starting gRPC server on localhost:50051...")
-
-    # Create and start gRPC server
-    agent = EchoAgent()
-    server = GRPCServer(agent, "localhost:50051")
-    await server.start()
-
-    try:
-        print("Server started! Creating client...\n")
 
-        # Create gRPC transport
-        transport = GRPCTransport("grpc://localhost:50051")
-        await transport.connect()
+    Args:
+        transport: Connected transport to the shared echo server
+    """
+    print("=" * 70 + "\nSCENARIO 1: Basic gRPC Communication\n" + "=" * 70 + "\n")
+    print("Using shared echo server on localhost:50051...\n")
 
-        # Create remote agent using the transport
-        remote = RemoteAgent("echo", transport=transport)
+    # Create remote agent using the shared transport
+    remote = RemoteAgent("echo", transport=transport)
 
-        # Send messages
-        messages = [
+    # Send messages (built once, outside the send loop)
+    messages = tuple(
+        Message(role="user", content=content)
+        for content in (
             "Hello, gRPC!",
             "This is fast and efficient.",
             "Protocol Buffers are awesome!",
-        ]
-
-        for msg_content in messages:
-            print(f"User: {msg_content}")
-            message = Message(role="user", content=msg_content)
-            response = await remote.process(message)
-            print(f"Agent: {response.content}")
-            print(f"Metadata: {response.metadata}\n")
-
-        # Clean up transport
-        await transport.close()
+        )
+    )
 
-        print("Benefits demonstrated:")
-        print("  - Simple request/response pattern")
-        print("  - Efficient binary encoding (Protocol Buffers)")
-        print("  - Type-safe communication")
-        print()
+    for message in messages:
+        print(f"User: {message.content}")
+        response = await remote.process(message)
+        print(f"Agent: {response.content}")
+        print(f"Metadata: {response.metadata}\n")
 
-    finally:
-        await server.stop()
-        print("Server stopped.\n")
+    print("Benefits demonstrated:")
+    print("  - Simple request/response pattern")
+    print("  - Efficient binary encoding (Protocol Buffers)")
+    print("  - Type-safe communication")
+    print()
 
 
 async def scenario_2_streaming_responses():
@@ -195,14 +205,11 @@ async def scenario_2_streaming_responses():
     where you'd need SSE or polling, gRPC has native streaming support
     with HTTP/2, making it perfect for real-time data delivery.
     """
-    print("=" * 70)
-    print("SCENARIO 2: Streaming Responses over gRPC")
-    print("=" * 70)
-    print()
+    print("=" * 70 + "\nSCENARIO 2: Streaming Responses over gRPC\n" + "=" * 70 + "\n")
     print("Starting gRPC server on localhost:50052...")
 
     # Create and start gRPC server
-    agent = StreamingEchoAgent()
+    agent = _STREAM
     server = GRPCServer(agent, "localhost:50052")
     await server.start()
 
@@ -231,10 +238,19 @@ async def scenario_2_streaming_responses():
         print(f"User: {message.content}")
         print("Agent: ", end="", flush=True)
 
-        start_time = time.time()
+        # Write chunks in batches to avoid one stdout flush per token
+        flush_every = 8
+        buf = []
+        start_time = time.monotonic()
         async for chunk in remote.stream(message):
-            print(f"{chunk.content} ", end="", flush=True)
-        elapsed = time.time() - start_time
+            buf.append(f"{chunk.content} ")
+            if len(buf) >= flush_every:
+                sys.stdout.write("".join(buf))
+                sys.stdout.flush()
+                buf.clear()
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+        elapsed = time.monotonic() - start_time
         print(f"\n\nStreaming completed in {elapsed:.2f}s")
 
         # Clean up transport
@@ -255,67 +271,60 @@ async def scenario_2_streaming_responses():
 async def scenario_3_concurrent_clients():
     """Scenario 3: Multiple Concurrent Clients.
 
-    WHY: Demonstrate gRPC's ability to handle multiple concurrent requests
-    efficiently. HTTP/2 connection multiplexing allows many concurrent RPCs
-    over a single TCP connection, reducing overhead.
+    WHY: Demonstrate a gRPC server handling requests from many clients at
+    once. Each client has its own channel and RemoteAgent, so nothing on the
+    client side serializes the requests and they are in flight together.
     """
-    print("=" * 70)
-    print("SCENARIO 3: Multiple Concurrent Clients")
-    print("=" * 70)
-    print()
-    print("Starting gRPC server on localhost:50053...")
-
-    # Create and start gRPC server
-    agent = EchoAgent()
-    server = GRPCServer(agent, "localhost:50053")
-    await server.start()
-
-    try:
-        print("Server started! Creating multiple concurrent clients...\n")
-
-        # Create multiple clients
-        num_clients = 10
-
-        async def send_request(client_id: int):
-            """Send a request from a client."""
-            # Each client creates its own transport
-            transport = GRPCTransport("grpc://localhost:50053")
-            await transport.connect()
-
-            remote = RemoteAgent("echo", transport=transport)
-
-            message = Message(
-                role="user",
-                content=f"Message from client {client_id}"
-            )
-
-            start = time.time()
-            response = await remote.process(message)
-            elapsed = time.time() - start
+    print("=" * 70 + "\nSCENARIO 3: Multiple Concurrent Clients\n" + "=" * 70 + "\n")
+    print("Using shared echo server on localhost:50051...")
+    print("Creating multiple concurrent clients, one channel each...\n")
+
+    num_clients = 10
+
+    # One channel per client on purpose. Sharing a GRPCTransport would not
+    # multiplex RPCs over HTTP/2 here: RemoteAgent holds a lock from each
+    # request to its response, and GRPCTransport runs each unary call under
+    # its own lock and hands replies back through one queue, so clients on a
+    # shared transport would send their requests one after another
+    transports = [GRPCTransport("grpc://localhost:50051") for _ in range(num_clients)]
+    remotes = [RemoteAgent("echo", transport=transport) for transport in transports]
+
+    async def send_request(client_id: int, remote: RemoteAgent):
+        """Send a request from a client."""
+        message = Message(
+            role="user",
+            content=f"Message from client {client_id}"
+        )
 
-            print(f"Client {client_id:2d}: {response.content} (took {elapsed*1000:.1f}ms)")
+        start = time.monotonic()
+        response = await remote.process(message)
+        elapsed = time.monotonic() - start
 
-            await transport.close()
+        print(f"Client {client_id:2d}: {response.content} (took {elapsed*1000:.1f}ms)")
 
+    try:
         # Send concurrent requests
-        start_time = time.time()
-        tasks = [send_request(i) for i in range(num_clients)]
-        await asyncio.gather(*tasks)
-        total_time = time.time() - start_time
-
-        print(f"\nAll {num_clients} clients completed in {total_time:.2f}s")
-        print(f"Average time per request: {(total_time/num_clients)*1000:.1f}ms")
+        start_time = time.monotonic()
+        if hasattr(asyncio, "TaskGroup"):
+            # Python 3.11+: structured concurrency, siblings cancelled on failure
+            async with asyncio.TaskGroup() as tg:
+                for i, remote in enumerate(remotes):
+                    tg.create_task(send_request(i, remote))
+        else:
+            await asyncio.gather(*(send_request(i, remote) for i, remote in enumerate(remotes)))
+        total_time = time.monotonic() - start_time
+    finally:
+        for transport in transports:
+            await transport.close()
 
-        print("\nBenefits demonstrated:")
-        print("  - Connection multiplexing over HTTP/2")
-        print("  - Efficient handling of concurrent requests")
-        print("  - Low per-request overhead")
-        print("  - Scalable for many clients")
-        print()
+    print(f"\nAll {num_clients} clients completed in {total_time:.2f}s")
+    print(f"Throughput: {num_clients / total_time:.0f} requests/s")
 
-    finally:
-        await server.stop()
-        print("Server stopped.\n")
+    print("\nBenefits demonstrated:")
+    print("  - Server handles many clients concurrently")
+    print("  - Independent channels, no client-side serialization")
+    print("  - Low per-request overhead")
+    print()
 
 
 async def scenario_4_metadata_handling():
@@ -325,14 +334,11 @@ async def scenario_4_metadata_handling():
     This is useful for tracing, authentication, request context, and
     passing additional information without modifying the message schema.
     """
-    print("=" * 70)
-    print("SCENARIO 4: Metadata Handling")
-    print("=" * 70)
-    print()
+    print("=" * 70 + "\nSCENARIO 4: Metadata Handling\n" + "=" * 70 + "\n")
     print("Starting gRPC server on localhost:50054...")
 
     # Create and start gRPC server
-    agent = MetadataAgent()
+    agent = _META
     server = GRPCServer(agent, "localhost:50054")
     await server.start()
 
@@ -346,32 +352,29 @@ async def scenario_4_metadata_handling():
         # Create remote agent
         remote = RemoteAgent("metadata", transport=transport)
 
-        # Send messages with metadata
-        test_cases = [
-            {
-                "content": "Request with user ID",
-                "metadata": {"user_id": "user123", "session": "abc-def"}
-            },
-            {
-                "content": "Request with trace ID",
-                "metadata": {"trace_id": "trace-456", "priority": "high"}
-            },
-            {
-                "content": "Request with custom headers",
-                "metadata": {"custom": "value", "version": "1.0"}
-            },
-        ]
-
-        for i, test in enumerate(test_cases, 1):
-            print(f"--- Test {i} ---")
-            print(f"User: {test['content']}")
-            print(f"Input metadata: {test['metadata']}")
-
-            message = Message(
+        # Send messages with metadata (built once, outside the send loop)
+        test_cases = (
+            Message(
                 role="user",
-                content=test["content"],
-                metadata=test["metadata"]
-            )
+                content="Request with user ID",
+                metadata={"user_id": "user123", "session": "abc-def"}
+            ),
+            Message(
+                role="user",
+                content="Request with trace ID",
+                metadata={"trace_id": "trace-456", "priority": "high"}
+            ),
+            Message(
+                role="user",
+                content="Request with custom headers",
+                metadata={"custom": "value", "version": "1.0"}
+            ),
+        )
+
+        for i, message in enumerate(test_cases, 1):
+            print(f"--- Test {i} ---")
+            print(f"User: {message.content}")
+            print(f"Input metadata: {message.metadata}")
 
             response = await remote.process(message)
             print(f"Agent: {response.content}")
@@ -398,10 +401,7 @@ async def scenario_5_error_handling():
     error codes and details. gRPC has rich error handling with standard
     status codes, making it easier to handle failures properly.
     """
-    print("=" * 70)
-    print("SCENARIO 5: Error Handling and Recovery")
-    print("=" * 70)
-    print()
+    print("=" * 70 + "\nSCENARIO 5: Error Handling and Recovery\n" + "=" * 70 + "\n")
 
     # Test 1: Connection refused (server not running)
     print("--- Test 1: Connection to unavailable server ---")
@@ -432,7 +432,7 @@ async def scenario_5_error_handling():
 
     # Test 2: Server shutdown during communication
     print("--- Test 2: Server shutdown during communication ---")
-    agent = EchoAgent()
+    agent = _ECHO
     server = GRPCServer(agent, "localhost:50055")
     await server.start()
     print("Server started")
@@ -474,35 +474,43 @@ async def scenario_5_error_handling():
 
     # Test 3: Retry and recovery
     print("--- Test 3: Retry and recovery ---")
-    server = GRPCServer(agent, "localhost:50056")
-    await server.start()
-    print("Server started")
 
-    try:
-        transport = GRPCTransport("grpc://localhost:50056")
-        await transport.connect()
+    # Channel retries are opt-in; the echo agent is idempotent, so a retried
+    # request is safe. Patient enough to ride out a server that starts late
+    retry_policy = {**UNAVAILABLE_RETRY_POLICY, "maxAttempts": 5, "initialBackoff": "0.5s"}
+    print(
+        f"Channel retry policy: up to {retry_policy['maxAttempts']} attempts "
+        f"on {', '.join(retry_policy['retryableStatusCodes'])}"
+    )
 
-        remote = RemoteAgent("echo", transport=transport)
+    server = GRPCServer(agent, "localhost:50056")
+    transport = GRPCTransport("grpc://localhost:50056", retry_policy=retry_policy)
+    await transport.connect()
+    remote = RemoteAgent("echo", transport=transport, timeout=10.0)
 
-        # Implement simple retry logic
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                message = Message(role="user", content=f"Attempt {attempt + 1}")
-                response = await asyncio.wait_for(remote.process(message), timeout=2.0)
-                print(f"Success on attempt {attempt + 1}: {response.content}")
-                break
-            except Exception as e:
-                print(f"Attempt {attempt + 1} failed: {type(e).__name__}")
-                if attempt < max_retries - 1:
-                    print("Retrying...")
-                    await asyncio.sleep(0.5)
-                else:
-                    print("Max retries reached")
+    async def start_server_late():
+        await asyncio.sleep(0.3)
+        await server.start()
+        print("Server started")
 
-        await transport.close()
+    try:
+        # The request goes out before the server is listening; the channel
+        # retries UNAVAILABLE with exponential backoff on its own, so no
+        # retry loop is needed here
+        print("Sending request before the server is up...")
+        starter = asyncio.create_task(start_server_late())
+        try:
+            start = time.monotonic()
+            message = Message(role="user", content="Request with transparent retries")
+            response = await remote.process(message)
+            elapsed = time.monotonic() - start
+            print(f"Success after {elapsed:.2f}s: {response.content}")
+        except Exception as e:
+            print(f"ERROR after retries: {type(e).__name__}: {e}")
+        await starter
 
     finally:
+        await transport.close()
         await server.stop()
 
     print()
@@ -522,19 +530,28 @@ async def main():
     print("╚" + "═" * 68 + "╝")
     print()
 
-    # Run scenarios
-    await scenario_1_basic_communication()
-    await asyncio.sleep(1)
+    # Scenarios 1 and 3 both talk to an EchoAgent, so they share one server.
+    # Scenario 1 reuses one transport; scenario 3 opens a channel per client.
+    # The other scenarios need a different agent (2, 4) or start and stop
+    # their own servers on purpose (5).
+    echo_server = GRPCServer(_ECHO, "localhost:50051")
+    await echo_server.start()
+    echo_transport = GRPCTransport("grpc://localhost:50051")
 
-    await scenario_2_streaming_responses()
-    await asyncio.sleep(1)
+    try:
+        await echo_transport.connect()
 
-    await scenario_3_concurrent_clients()
-    await asyncio.sleep(1)
+        # Run scenarios
+        await scenario_1_basic_communication(echo_transport)
+        await scenario_2_streaming_responses()
+        await scenario_3_concurrent_clients()
+    finally:
+        await echo_transport.close()
+        await echo_server.stop()
 
+    # Each scenario awaits server.stop() before returning, so no pause is
+    # needed between them
     await scenario_4_metadata_handling()
-    await asyncio.sleep(1)
-
     await scenario_5_error_handling()
 
     # Print summary
@@ -548,8 +565,7 @@ async def main():
     print("  ✓ Native streaming support (Scenario 2)")
     print("  ✓ Efficient concurrent handling (Scenario 3)")
     print("  ✓ Metadata propagation (Scenario 4)")
-    print("  ✓ Rich error handling (Scenario 5)")
-    print("  ✓ HTTP/2 connection multiplexing")
+    print("  ✓ Rich error handling and channel retries (Scenario 5)")
     print("  ✓ Language interoperability")
     print()
     print("gRPC is perfect for:")
@@ -54,6 +54,9 @@ Use **Unix Socket** when:
 """
 
 import asyncio
+import re
+import sys
+from contextlib import asynccontextmanager
 
 from agenkit import Agent, Message
 from agenkit.adapters.python import LocalAgent, RemoteAgent
@@ -62,33 +65,74 @@ from agenkit.adapters.python import LocalAgent, RemoteAgent
 class ChatAgent(Agent):
     """Simple chat agent that responds to messages."""
 
+    # One case-insensitive pattern for all keyword groups. Each branch is a
+    # lookahead anchored at the start, so branches are tried in priority
+    # order (a greeting wins over "help" wherever each appears) and
+    # match.lastindex tells which group matched.
+    _PATTERN = re.compile(
+        r"(?=.*?(hello|hi))|(?=.*?(how are you))|(?=.*?(bye|goodbye))|(?=.*?(help))",
+        re.IGNORECASE | re.DOTALL,
+    )
+    _RESPONSES = (
+        "Hello! I'm a chat agent. How can I help you today?",
+        "I'm doing great! Thanks for asking. How about you?",
+        "Goodbye! Have a great day!",
+        (
+            "I can respond to greetings, check how you're doing, "
+            "or provide information. Try asking me something!"
+        ),
+    )
+
     @property
     def name(self) -> str:
         return "chat"
 
     async def process(self, message: Message) -> Message:
         """Process a single message and return a complete response."""
-        user_message = message.content.lower()
-
-        if "hello" in user_message or "hi" in user_message:
-            response = "Hello! I'm a chat agent. How can I help you today?"
-        elif "how are you" in user_message:
-            response = "I'm doing great! Thanks for asking. How about you?"
-        elif "bye" in user_message or "goodbye" in user_message:
-            response = "Goodbye! Have a great day!"
-        elif "help" in user_message:
-            response = (
-                "I can respond to greetings, check how you're doing, "
-                "or provide information. Try asking me something!"
-            )
+        match = self._PATTERN.match(message.content)
+
+        if match:
+            response = self._RESPONSES[match.lastindex - 1]
         else:
             response = f"You said: '{message.content}'. That's interesting!"
 
         return Message(role="agent", content=response)
 
 
+_STORY_PARTS = (
+    "Once upon a time, in a land of code and data,",
+    "there lived agents who processed messages.",
+    "They communicated over many transports:",
+    "HTTP for simplicity, TCP for speed,",
+    "Unix sockets for local efficiency,",
+    "but WebSocket was their favorite for real-time chat.",
+    "The persistent connection kept them together,",
+    "and the low latency made conversations flow naturally.",
+    "And they all lived happily ever after.",
+    "The End.",
+)
+
+# Messages are immutable, so the streamed chunks are built once at import
+_STORY_MESSAGES = tuple(
+    Message(
+        role="agent",
+        content=part,
+        metadata={"part": i + 1, "total": len(_STORY_PARTS)},
+    )
+    for i, part in enumerate(_STORY_PARTS)
+)
+
+
 class StoryAgent(Agent):
-    """Agent that streams a story in chunks."""
+    """Agent that streams a story in chunks.
+
+    Args:
+        chunk_delay: Seconds to wait before each streamed chunk, simulating
+            natural typing. Pass 0 to stream as fast as possible.
+    """
+
+    def __init__(self, chunk_delay: float = 0.3):
+        self._delay = chunk_delay
 
     @property
     def name(self) -> str:
@@ -109,74 +153,125 @@ class StoryAgent(Agent):
 
     async def stream(self, message: Message):
         """Stream story one sentence at a time."""
-        story_parts = [
-            "Once upon a time, in a land of code and data,",
-            "there lived agents who processed messages.",
-            "They communicated over many transports:",
-            "HTTP for simplicity, TCP for speed,",
-            "Unix sockets for local efficiency,",
-            "but WebSocket was their favorite for real-time chat.",
-            "The persistent connection kept them together,",
-            "and the low latency made conversations flow naturally.",
-            "And they all lived happily ever after.",
-            "The End.",
-        ]
-
-        for i, part in enumerate(story_parts):
-            # Simulate natural typing delay
-            await asyncio.sleep(0.3)
-            yield Message(
-                role="agent",
-                content=part,
-                metadata={"part": i + 1, "total": len(story_parts)},
-            )
-
-
-async def run_chat_example():
+        for chunk in _STORY_MESSAGES:
+            # Simulate natural typing delay; no timer at all when disabled
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            yield chunk
+
+
+@asynccontextmanager
+async def chat_server(port):
+    """Serve a ChatAgent on ``port`` and yield its endpoint and one client.
+
+    The chat examples share this server, so the whole demo pays for a single
+    server start. The sequential examples also share the client connection.
+    """
+    endpoint = f"ws://127.0.0.1:{port}"
+    print(f"Starting WebSocket server on {endpoint}...")
+
+    server = LocalAgent(ChatAgent(), endpoint=endpoint)
+    await server.start()
+
+    try:
+        remote = RemoteAgent("chat", endpoint=endpoint)
+        print("Client connected!\n")
+        yield endpoint, remote
+    finally:
+        await server.stop()
+        print("Server stopped.\n")
+
+
+async def run_chat_example(remote):
     """Demonstrate basic WebSocket request/response."""
     print("=" * 70)
     print("EXAMPLE 1: Basic Chat with WebSocket")
     print("=" * 70)
     print()
-    print("Starting WebSocket server on ws://127.0.0.1:8765...")
 
-    # Create and start server
-    chat_agent = ChatAgent()
-    server = LocalAgent(chat_agent, endpoint="ws://127.0.0.1:8765")
-    await server.start()
+    # Have a conversation
+    conversation = [
+        "Hello!",
+        "How are you?",
+        "What can you do?",
+        "Tell me something interesting.",
+        "Goodbye!",
+    ]
+
+    for user_msg in conversation:
+        print(f"User: {user_msg}")
+        message = Message(role="user", content=user_msg)
+        response = await remote.process(message)
+        print(f"Agent: {response.content}\n")
 
-    try:
-        # Create client
-        remote = RemoteAgent("chat", endpoint="ws://127.0.0.1:8765")
-        print("Client connected!\n")
+        # Small delay between messages
+        await asyncio.sleep(0.5)
 
-        # Have a conversation
-        conversation = [
-            "Hello!",
-            "How are you?",
-            "What can you do?",
-            "Tell me something interesting.",
-            "Goodbye!",
-        ]
 
-        for user_msg in conversation:
-            print(f"User: {user_msg}")
-            message = Message(role="user", content=user_msg)
-            response = await remote.process(message)
-            print(f"Agent: {response.content}\n")
+async def run_concurrent_example(endpoint):
+    """Demonstrate concurrent clients, each with its own WebSocket connection."""
+    print("=" * 70)
+    print("EXAMPLE 2: Concurrent WebSocket Connections")
+    print("=" * 70)
+    print()
+    print("Running 5 concurrent clients, one connection each...\n")
+
+    # One connection per client on purpose. A RemoteAgent holds a lock from
+    # each request to its response, so clients sharing one agent (and its
+    # WebSocket) would run one after another. A single caller with a batch
+    # can still use one connection: RemoteAgent.process_many pipelines it
+    clients = [RemoteAgent("chat", endpoint=endpoint) for _ in range(5)]
 
-            # Small delay between messages
-            await asyncio.sleep(0.5)
+    async def send_message(client_id, remote):
+        message = Message(role="user", content=f"Hello from client {client_id}")
+        response = await remote.process(message)
+        print(f"Client {client_id}: {response.content}")
 
+    try:
+        if hasattr(asyncio, "TaskGroup"):
+            # Python 3.11+: structured concurrency, siblings cancelled on failure
+            async with asyncio.TaskGroup() as tg:
+                for i, remote in enumerate(clients):
+                    tg.create_task(send_message(i, remote))
+        else:
+            await asyncio.gather(*(send_message(i, remote) for i, remote in enumerate(clients)))
     finally:
-        await server.stop()
-        print("Server stopped.\n")
+        for remote in clients:
+            await remote.close()
+
+    print("\nAll clients completed successfully!")
+    print(
+        "Note: the server handles each client's connection independently,\n"
+        "so their requests are processed concurrently.\n"
+    )
+
+
+async def run_persistence_example(remote):
+    """Demonstrate WebSocket connection persistence."""
+    print("=" * 70)
+    print("EXAMPLE 3: Connection Persistence")
+    print("=" * 70)
+    print()
+    print("Sending 10 messages over the same persistent connection...\n")
+
+    # Pipeline all messages over the same connection: every request is
+    # written before the responses are read, so the batch costs about
+    # one round trip instead of ten
+    messages = [Message(role="user", content=f"Message {i + 1}") for i in range(10)]
+    responses = await remote.process_many(messages)
+    for i, response in enumerate(responses):
+        print(f"  [{i + 1}/10] {response.content}")
+
+    print(
+        "\nAll messages sent over a SINGLE WebSocket connection!"
+        "\n(With HTTP, each request would need a new connection or keep-alive)\n"
+    )
 
 
 async def run_streaming_example():
     """Demonstrate WebSocket streaming."""
     print("=" * 70)
-    print("EXAMPLE 2: Streaming Story with WebSocket")
+    print("EXAMPLE 4: Streaming Story with WebSocket")
     print("=" * 70)
     print()
     print("Starting WebSocket server on ws://127.0.0.1:8766...")
@@ -206,11 +301,17 @@ async def run_streaming_example():
         print("Agent: ", end="", flush=True)
 
         message = Message(role="user", content="Tell me a story")
+        # Write chunks in batches to avoid one stdout flush per token
+        flush_every = 8
+        buf = []
         async for chunk in remote.stream(message):
-            print(f"{chunk.content} ", end="", flush=True)
-            # Part indicator
-            if chunk.metadata.get("part") == chunk.metadata.get("total"):
-                print()  # New line at the end
+            buf.append(f"{chunk.content} ")
+            if len(buf) >= flush_every:
+                sys.stdout.write("".join(buf))
+                sys.stdout.flush()
+                buf.clear()
+        sys.stdout.write("".join(buf) + "\n")
+        sys.stdout.flush()
 
         print()
 
@@ -219,83 +320,6 @@ async def run_streaming_example():
         print("\nServer stopped.\n")
 
 
-async def run_concurrent_example():
-    """Demonstrate concurrent WebSocket connections."""
-    print("=" * 70)
-    print("EXAMPLE 3: Concurrent WebSocket Connections")
-    print("=" * 70)
-    print()
-    print("Starting WebSocket server on ws://127.0.0.1:8767...")
-
-    # Create and start server
-    chat_agent = ChatAgent()
-    server = LocalAgent(chat_agent, endpoint="ws://127.0.0.1:8767")
-    await server.start()
-
-    try:
-        print("Creating 5 concurrent clients...\n")
-
-        # Create multiple clients
-        clients = [
-            RemoteAgent("chat", endpoint="ws://127.0.0.1:8767") for _ in range(5)
-        ]
-
-        # Send concurrent requests
-        async def send_message(client_id, remote):
-            message = Message(role="user", content=f"Hello from client {client_id}")
-            response = await remote.process(message)
-            print(f"Client {client_id}: {response.content}")
-
-        tasks = [send_message(i, client) for i, client in enumerate(clients)]
-        await asyncio.gather(*tasks)
-
-        print("\nAll clients completed successfully!")
-        print(
-            "Note: WebSocket maintains separate connections for each client,\n"
-            "allowing true concurrent communication."
-        )
-
-    finally:
-        await server.stop()
-        print("\nServer stopped.\n")
-
-
-async def run_persistence_example():
-    """Demonstrate WebSocket connection persistence."""
-    print("=" * 70)
-    print("EXAMPLE 4: Connection Persistence")
-    print("=" * 70)
-    print()
-    print("Starting WebSocket server on ws://127.0.0.1:8768...")
-
-    # Create and start server
-    chat_agent = ChatAgent()
-    server = LocalAgent(chat_agent, endpoint="ws://127.0.0.1:8768")
-    await server.start()
-
-    try:
-        # Create client
-        remote = RemoteAgent("chat", endpoint="ws://127.0.0.1:8768")
-        print("Client connected!\n")
-
-        print("Sending 10 messages over the same persistent connection...\n")
-
-        # Send multiple messages over the same connection
-        for i in range(10):
-            message = Message(role="user", content=f"Message {i + 1}")
-            response = await remote.process(message)
-            print(f"  [{i + 1}/10] {response.content}")
-
-        print(
-            "\nAll messages sent over a SINGLE WebSocket connection!"
-            "\n(With HTTP, each request would need a new connection or keep-alive)"
-        )
-
-    finally:
-        await server.stop()
-        print("\nServer stopped.\n")
-
-
 async def main():
     """Run all examples."""
     print("\n")
@@ -304,17 +328,18 @@ async def main():
     print("╚" + "═" * 68 + "╝")
     print()
 
-    # Run examples
-    await run_chat_example()
-    await asyncio.sleep(1)
+    # The chat examples share one server, and the sequential ones one client
+    # connection; the streaming example needs its own StoryAgent server
+    async with chat_server(8765) as (endpoint, remote):
+        await run_chat_example(remote)
+        await asyncio.sleep(1)
 
-    await run_streaming_example()
-    await asyncio.sleep(1)
+        await run_concurrent_example(endpoint)
+        await asyncio.sleep(1)
 
-    await run_concurrent_example()
-    await asyncio.sleep(1)
+        await run_persistence_example(remote)
 
-    await run_persistence_example()
+    await run_streaming_example()
 
     # Print summary
     print("=" * 70)
@@ -322,10 +347,10 @@ async def main():
     print("=" * 70)
     print()
     print("WebSocket Benefits Demonstrated:")
-    print("  ✓ Persistent connection (Example 4)")
+    print("  ✓ Persistent connection shared by Examples 1 and 3")
     print("  ✓ Low-latency communication (All examples)")
-    print("  ✓ Excellent streaming support (Example 2)")
-    print("  ✓ Concurrent connections (Example 3)")
+    print("  ✓ Excellent streaming support (Example 4)")
+    print("  ✓ Concurrent clients, one connection each (Example 2)")
     print("  ✓ Bidirectional communication capability")
     print()
     print("WebSocket is perfect for:")
@@ -341,4 +366,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use the libuv-based event loop for socket I/O when it is available
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
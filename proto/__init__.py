@@ -1,21 +1,24 @@
 """Protocol buffer definitions for agenkit gRPC transport."""
 
-from .agent_pb2 import (
-    ChunkType,
-    Error,
-    Message,
-    Request,
-    Response,
-    ResponseType,
-    StreamChunk,
-    ToolCall,
-    ToolResult,
-)
-from .agent_pb2_grpc import (
-    AgentServiceServicer,
-    AgentServiceStub,
-    add_AgentServiceServicer_to_server,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent_pb2 import (
+        ChunkType,
+        Error,
+        Message,
+        Request,
+        Response,
+        ResponseType,
+        StreamChunk,
+        ToolCall,
+        ToolResult,
+    )
+    from .agent_pb2_grpc import (
+        AgentServiceServicer,
+        AgentServiceStub,
+        add_AgentServiceServicer_to_server,
+    )
 
 __all__ = [
     "ChunkType",
@@ -31,3 +34,36 @@ __all__ = [
     "AgentServiceStub",
     "add_AgentServiceServicer_to_server",
 ]
+
+# The generated modules are imported on first access (PEP 562): building the
+# descriptor pool and initializing grpc is skipped until a name is used.
+_LAZY_IMPORTS = {
+    "ChunkType": "agent_pb2",
+    "Error": "agent_pb2",
+    "Message": "agent_pb2",
+    "Request": "agent_pb2",
+    "Response": "agent_pb2",
+    "ResponseType": "agent_pb2",
+    "StreamChunk": "agent_pb2",
+    "ToolCall": "agent_pb2",
+    "ToolResult": "agent_pb2",
+    "AgentServiceServicer": "agent_pb2_grpc",
+    "AgentServiceStub": "agent_pb2_grpc",
+    "add_AgentServiceServicer_to_server": "agent_pb2_grpc",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
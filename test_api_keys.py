@@ -13,6 +13,7 @@ Setup:
 """
 
 import asyncio
+import io
 import os
 from pathlib import Path
 
@@ -31,135 +32,158 @@ except ImportError:
     print("⚠ python-dotenv not installed. Using system environment variables.")
     print("  Install with: pip install python-dotenv")
 
-from agenkit import Message
+from agenkit.interfaces import Message
 
-# Test message
-TEST_MESSAGE = [Message(role="user", content="Say 'Hello from Agenkit!' and nothing else.")]
+# AWS credential availability for Bedrock, checked once at startup
+HAS_AWS_CREDS = bool(
+    os.getenv("AWS_ACCESS_KEY_ID")
+    or os.getenv("AWS_PROFILE")
+    or (Path.home() / ".aws" / "credentials").is_file()
+)
+
+# Test message, shared by every adapter check (Messages are immutable)
+TEST_MESSAGE = (Message(role="user", content="Say 'Hello from Agenkit!' and nothing else."),)
 
 
 async def test_anthropic():
     """Test Anthropic Claude adapter."""
+    out = io.StringIO()
     try:
         from agenkit.adapters.llm import AnthropicLLM
 
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
-            print("⏭  Skipping Anthropic (ANTHROPIC_API_KEY not set)")
+            print("⏭  Skipping Anthropic (ANTHROPIC_API_KEY not set)", file=out)
             return
 
-        print("\n🧪 Testing Anthropic Claude...")
+        print("\n🧪 Testing Anthropic Claude...", file=out)
         # Use Claude 3 Haiku - stable and widely available
         llm = AnthropicLLM(api_key=api_key, model="claude-3-haiku-20240307")
         response = await llm.complete(TEST_MESSAGE, max_tokens=50)
-        print(f"✅ Anthropic works!")
-        print(f"   Model: {response.metadata.get('model')}")
-        print(f"   Response: {response.content[:100]}")
+        print(f"✅ Anthropic works!", file=out)
+        print(f"   Model: {response.metadata.get('model')}", file=out)
+        print(f"   Response: {response.content[:100]}", file=out)
     except ImportError:
-        print("⏭  Skipping Anthropic (anthropic package not installed)")
+        print("⏭  Skipping Anthropic (anthropic package not installed)", file=out)
     except Exception as e:
-        print(f"❌ Anthropic failed: {e}")
+        print(f"❌ Anthropic failed: {e}", file=out)
+    finally:
+        # One write per check, so concurrent checks do not interleave
+        print(out.getvalue(), end="")
 
 
 async def test_openai():
     """Test OpenAI GPT adapter."""
+    out = io.StringIO()
     try:
         from agenkit.adapters.llm import OpenAILLM
 
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
-            print("⏭  Skipping OpenAI (OPENAI_API_KEY not set)")
+            print("⏭  Skipping OpenAI (OPENAI_API_KEY not set)", file=out)
             return
 
-        print("\n🧪 Testing OpenAI GPT...")
+        print("\n🧪 Testing OpenAI GPT...", file=out)
         llm = OpenAILLM(api_key=api_key, model="gpt-4o-mini")
         response = await llm.complete(TEST_MESSAGE, max_tokens=50)
-        print(f"✅ OpenAI works!")
-        print(f"   Model: {response.metadata.get('model')}")
-        print(f"   Response: {response.content[:100]}")
+        print(f"✅ OpenAI works!", file=out)
+        print(f"   Model: {response.metadata.get('model')}", file=out)
+        print(f"   Response: {response.content[:100]}", file=out)
     except ImportError:
-        print("⏭  Skipping OpenAI (openai package not installed)")
+        print("⏭  Skipping OpenAI (openai package not installed)", file=out)
     except Exception as e:
-        print(f"❌ OpenAI failed: {e}")
+        print(f"❌ OpenAI failed: {e}", file=out)
+    finally:
+        # One write per check, so concurrent checks do not interleave
+        print(out.getvalue(), end="")
 
 
 async def test_gemini():
     """Test Google Gemini adapter."""
+    out = io.StringIO()
     try:
         from agenkit.adapters.llm import GeminiLLM
 
         api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if not api_key:
-            print("⏭  Skipping Gemini (GEMINI_API_KEY or GOOGLE_API_KEY not set)")
+            print("⏭  Skipping Gemini (GEMINI_API_KEY or GOOGLE_API_KEY not set)", file=out)
             return
 
-        print("\n🧪 Testing Google Gemini...")
+        print("\n🧪 Testing Google Gemini...", file=out)
         llm = GeminiLLM(api_key=api_key, model="gemini-2.0-flash-exp")
         response = await llm.complete(TEST_MESSAGE, max_tokens=50)
-        print(f"✅ Gemini works!")
-        print(f"   Model: {response.metadata.get('model')}")
-        print(f"   Response: {response.content[:100]}")
+        print(f"✅ Gemini works!", file=out)
+        print(f"   Model: {response.metadata.get('model')}", file=out)
+        print(f"   Response: {response.content[:100]}", file=out)
     except ImportError:
-        print("⏭  Skipping Gemini (google-genai package not installed)")
+        print("⏭  Skipping Gemini (google-genai package not installed)", file=out)
     except Exception as e:
-        print(f"❌ Gemini failed: {e}")
+        print(f"❌ Gemini failed: {e}", file=out)
+    finally:
+        # One write per check, so concurrent checks do not interleave
+        print(out.getvalue(), end="")
 
 
 async def test_bedrock():
     """Test Amazon Bedrock adapter."""
+    out = io.StringIO()
     try:
         from agenkit.adapters.llm import BedrockLLM
 
         # Bedrock uses AWS credential chain - check if configured
         region = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
-        has_creds = bool(
-            os.getenv("AWS_ACCESS_KEY_ID")
-            or os.getenv("AWS_PROFILE")
-            or Path.home() / ".aws" / "credentials"
-        )
 
-        if not has_creds:
+        if not HAS_AWS_CREDS:
             print(
                 "⏭  Skipping Bedrock (AWS credentials not configured)\n"
-                "   Configure with: aws configure"
+                "   Configure with: aws configure",
+                file=out,
             )
             return
 
-        print("\n🧪 Testing Amazon Bedrock...")
+        print("\n🧪 Testing Amazon Bedrock...", file=out)
         llm = BedrockLLM(
             model_id="anthropic.claude-3-haiku-20240307-v1:0", region_name=region
         )
         response = await llm.complete(TEST_MESSAGE, max_tokens=50)
-        print(f"✅ Bedrock works!")
-        print(f"   Model: {response.metadata.get('model')}")
-        print(f"   Response: {response.content[:100]}")
+        print(f"✅ Bedrock works!", file=out)
+        print(f"   Model: {response.metadata.get('model')}", file=out)
+        print(f"   Response: {response.content[:100]}", file=out)
     except ImportError:
-        print("⏭  Skipping Bedrock (boto3 package not installed)")
+        print("⏭  Skipping Bedrock (boto3 package not installed)", file=out)
     except Exception as e:
-        print(f"❌ Bedrock failed: {e}")
+        print(f"❌ Bedrock failed: {e}", file=out)
+    finally:
+        # One write per check, so concurrent checks do not interleave
+        print(out.getvalue(), end="")
 
 
 async def test_ollama():
     """Test Ollama adapter."""
+    out = io.StringIO()
     try:
         from agenkit.adapters.llm import OllamaLLM
 
         host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 
-        print("\n🧪 Testing Ollama...")
-        print(f"   Host: {host}")
-        print("   Note: Make sure Ollama is running and a model is pulled")
-        print("   (e.g., `ollama pull llama2`)")
+        print("\n🧪 Testing Ollama...", file=out)
+        print(f"   Host: {host}", file=out)
+        print("   Note: Make sure Ollama is running and a model is pulled", file=out)
+        print("   (e.g., `ollama pull llama2`)", file=out)
 
         llm = OllamaLLM(model="llama2", base_url=host)
         response = await llm.complete(TEST_MESSAGE, max_tokens=50)
-        print(f"✅ Ollama works!")
-        print(f"   Model: {response.metadata.get('model')}")
-        print(f"   Response: {response.content[:100]}")
+        print(f"✅ Ollama works!", file=out)
+        print(f"   Model: {response.metadata.get('model')}", file=out)
+        print(f"   Response: {response.content[:100]}", file=out)
     except ImportError:
-        print("⏭  Skipping Ollama (ollama package not installed)")
+        print("⏭  Skipping Ollama (ollama package not installed)", file=out)
     except Exception as e:
-        print(f"❌ Ollama failed: {e}")
-        print("   Make sure Ollama is running: ollama serve")
+        print(f"❌ Ollama failed: {e}", file=out)
+        print("   Make sure Ollama is running: ollama serve", file=out)
+    finally:
+        # One write per check, so concurrent checks do not interleave
+        print(out.getvalue(), end="")
 
 
 async def main():
@@ -168,12 +192,15 @@ async def main():
     print("Agenkit LLM Adapter API Key Test")
     print("=" * 60)
 
-    # Test all adapters
-    await test_anthropic()
-    await test_openai()
-    await test_gemini()
-    await test_bedrock()
-    await test_ollama()
+    # Test all adapters concurrently; the checks are independent network calls
+    await asyncio.gather(
+        test_anthropic(),
+        test_openai(),
+        test_gemini(),
+        test_bedrock(),
+        test_ollama(),
+        return_exceptions=True,
+    )
 
     print("\n" + "=" * 60)
     print("Testing complete!")
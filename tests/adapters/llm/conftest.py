@@ -1,13 +1,23 @@
 """Shared fixtures and utilities for LLM adapter tests."""
 
+import functools
+import importlib.util
 import os
+import socket
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 from agenkit.interfaces import Message
 
+try:
+    from pytest_recording.plugin import get_default_cassette_name
+except ImportError:  # pytest-recording not installed, nothing to replay
+    get_default_cassette_name = None
+
 # Load .env file for integration tests
 try:
     from dotenv import load_dotenv
@@ -18,8 +28,85 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, use system env vars
 
+_HERE = Path(__file__).parent
 
-@pytest.fixture
+# CI replays committed cassettes strictly instead of recording new ones
+_IN_CI = bool(os.getenv("CI"))
+
+# Whether a test replays an existing cassette, set at collection time
+_REPLAYING = pytest.StashKey[bool]()
+
+# Stands in for missing credentials when a test only replays a cassette
+_REPLAY_API_KEY = "replayed-from-cassette"
+
+def _has_cassette(item) -> bool:
+    """Whether pytest-recording would replay an existing cassette for item."""
+    if get_default_cassette_name is None or item.config.getoption("--disable-recording", False):
+        return False
+    name = get_default_cassette_name(item.cls, item.name)
+    return (item.path.parent / "cassettes" / item.path.stem / f"{name}.yaml").is_file()
+
+
+def pytest_collection_modifyitems(items):
+    """Pin each provider's integration tests to one pytest-xdist worker.
+
+    Under ``-n auto --dist loadgroup`` the mocked unit tests spread across
+    workers, while real API calls to a rate-limited provider stay serial.
+
+    Integration tests also replay their HTTP traffic from a VCR.py cassette
+    (with pytest-recording installed). A test with a cassette runs without
+    credentials. In CI only tests with a cassette are recorded/replayed, so
+    the rest still call the real API when credentials are set. The streaming
+    tests are left out: their stream is collected by the streamed_chunks
+    fixture, outside the test's cassette.
+    """
+    for item in items:
+        if _HERE in item.path.parents and item.get_closest_marker("integration"):
+            provider = item.path.stem.removeprefix("test_")
+            item.add_marker(pytest.mark.xdist_group(f"integration_{provider}"))
+            if "streamed_chunks" not in item.fixturenames:
+                replaying = _has_cassette(item)
+                item.stash[_REPLAYING] = replaying
+                if replaying or not _IN_CI:
+                    item.add_marker(pytest.mark.vcr)
+
+
+@pytest.fixture(scope="session")
+def record_mode(request):
+    """Record a missing cassette on first run and replay it afterwards.
+
+    Overrides pytest-recording's default of "none" for local runs. CI keeps
+    "none", so a request the cassette does not hold fails instead of being
+    recorded. ``--record-mode`` takes precedence; use ``rewrite`` to refresh
+    stale cassettes (see TESTING.md).
+    """
+    return request.config.getoption("--record-mode") or ("none" if _IN_CI else "once")
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Keep credentials out of recorded cassettes."""
+    return {
+        "filter_headers": [
+            "authorization",
+            "x-api-key",
+            "x-goog-api-key",
+            "x-amz-security-token",
+        ],
+        "filter_query_parameters": ["key"],
+    }
+
+
+# AWS credential availability, checked once after .env is loaded
+_AWS_PROFILE = os.getenv("AWS_PROFILE", "aws")
+_HAS_AWS_CREDS = bool(
+    os.getenv("AWS_ACCESS_KEY_ID")
+    or os.getenv("AWS_PROFILE")
+    or (Path.home() / ".aws" / "credentials").is_file()
+)
+
+
+@pytest.fixture(scope="module")
 def test_messages():
     """Standard test messages for adapter testing."""
     return [
@@ -28,138 +115,215 @@ def test_messages():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_test_message():
     """Single simple test message."""
     return [Message(role="user", content="Hello!")]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def expected_response_content():
     """Expected response content for tests."""
     return "Hello! I'm doing well, thank you for asking."
 
 
+def _replaying(request) -> bool:
+    """Whether the requesting test replays an existing cassette."""
+    return request.node.stash.get(_REPLAYING, False)
+
+
+def _api_key(request, *env_vars: str) -> str:
+    """Return the first API key set in env_vars.
+
+    A test replaying a cassette gets a placeholder instead; any other test
+    is skipped.
+    """
+    for env_var in env_vars:
+        api_key = os.getenv(env_var)
+        if api_key:
+            return api_key
+    if _replaying(request):
+        return _REPLAY_API_KEY
+    pytest.skip(f"{' or '.join(env_vars)} not set")
+
+
 # API Key fixtures
 @pytest.fixture
-def anthropic_api_key():
+def anthropic_api_key(request):
     """Get Anthropic API key from environment, skip if not present."""
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        pytest.skip("ANTHROPIC_API_KEY not set")
-    return api_key
+    return _api_key(request, "ANTHROPIC_API_KEY")
 
 
 @pytest.fixture
-def openai_api_key():
+def openai_api_key(request):
     """Get OpenAI API key from environment, skip if not present."""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        pytest.skip("OPENAI_API_KEY not set")
-    return api_key
+    return _api_key(request, "OPENAI_API_KEY")
 
 
 @pytest.fixture
-def gemini_api_key():
+def gemini_api_key(request):
     """Get Gemini API key from environment, skip if not present."""
-    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        pytest.skip("GEMINI_API_KEY or GOOGLE_API_KEY not set")
-    return api_key
+    return _api_key(request, "GEMINI_API_KEY", "GOOGLE_API_KEY")
 
 
 @pytest.fixture
-def aws_profile():
-    """Get AWS profile for Bedrock testing."""
-    profile = os.getenv("AWS_PROFILE", "aws")
-    # Check if AWS is configured
-    has_creds = bool(
-        os.getenv("AWS_ACCESS_KEY_ID")
-        or os.getenv("AWS_PROFILE")
-        or (os.path.expanduser("~/.aws/credentials"))
-    )
-    if not has_creds:
-        pytest.skip("AWS credentials not configured")
-    return profile
+def aws_profile(request, monkeypatch):
+    """Get AWS profile for Bedrock testing.
+
+    Replays sign requests with placeholder environment credentials instead,
+    and return no profile.
+    """
+    if _HAS_AWS_CREDS:
+        return _AWS_PROFILE
+    if _replaying(request):
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", _REPLAY_API_KEY)
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", _REPLAY_API_KEY)
+        return None
+    pytest.skip("AWS credentials not configured")
+
+
+@functools.cache
+def _ollama_running() -> bool:
+    try:
+        # Try to connect to Ollama default port; localhost answers or
+        # refuses almost immediately, so a short timeout is enough
+        with socket.create_connection(("localhost", 11434), timeout=0.1):
+            return True
+    except OSError:
+        return False
 
 
 @pytest.fixture
-def ollama_available():
-    """Check if Ollama is available."""
-    import socket
+def ollama_available(request):
+    """Check if Ollama is available, or the test replays a cassette.
 
-    try:
-        # Try to connect to Ollama default port
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex(("localhost", 11434))
-        sock.close()
-        if result != 0:
-            pytest.skip("Ollama not running on localhost:11434")
-        return True
-    except Exception:
-        pytest.skip("Could not check Ollama availability")
+    The server is probed once per session; every test reuses the result.
+    """
+    if not (_ollama_running() or _replaying(request)):
+        pytest.skip("Ollama not running on localhost:11434")
+    return True
 
 
 # Mock fixtures for unit tests
-@pytest.fixture
+# Responses are read-only test inputs, so they are built once per module as
+# plain SimpleNamespace objects (no MagicMock attribute machinery).
+# Client mocks are also built once per module; the function-scoped
+# mock_*_client fixtures clear their recorded calls before each test.
+@pytest.fixture(scope="module")
 def mock_anthropic_response(expected_response_content):
     """Mock Anthropic API response."""
-    mock_response = MagicMock()
-    mock_response.content = [MagicMock(text=expected_response_content)]
-    mock_response.usage = MagicMock(input_tokens=10, output_tokens=15)
-    mock_response.stop_reason = "end_turn"
-    mock_response.id = "msg_test123"
-    return mock_response
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=expected_response_content)],
+        usage=SimpleNamespace(input_tokens=10, output_tokens=15),
+        stop_reason="end_turn",
+        id="msg_test123",
+    )
 
 
-@pytest.fixture
-def mock_anthropic_client(mock_anthropic_response):
-    """Mock AsyncAnthropic client."""
+@pytest.fixture(scope="module")
+def _anthropic_client_mock(mock_anthropic_response):
     mock_client = AsyncMock()
     mock_client.messages.create = AsyncMock(return_value=mock_anthropic_response)
     return mock_client
 
 
 @pytest.fixture
+def mock_anthropic_client(_anthropic_client_mock):
+    """Mock AsyncAnthropic client."""
+    _anthropic_client_mock.reset_mock()
+    return _anthropic_client_mock
+
+
+@pytest.fixture(scope="module")
+def anthropic_llm():
+    """AnthropicLLM built once per module.
+
+    Constructing the adapter creates an AsyncAnthropic HTTP client, so unit
+    tests share one instance and swap in a mock client with monkeypatch.
+    """
+    pytest.importorskip("anthropic")
+    from agenkit.adapters.llm import AnthropicLLM
+
+    return AnthropicLLM(api_key="test-key")
+
+
+@pytest.fixture(scope="session")
+def _anthropic_haiku_llm():
+    pytest.importorskip("anthropic")
+    from agenkit.adapters.llm import AnthropicLLM
+
+    api_key = os.getenv("ANTHROPIC_API_KEY") or _REPLAY_API_KEY
+    return AnthropicLLM(api_key=api_key, model="claude-3-haiku-20240307")
+
+
+@pytest.fixture
+def anthropic_haiku_llm(anthropic_api_key, _anthropic_haiku_llm):
+    """AnthropicLLM for integration tests, shared by the whole session.
+
+    Reusing one adapter reuses its HTTP connection pool, so integration
+    tests pay for one TLS handshake instead of one per test. The API key
+    check (or skip) still runs per test, so replays work without a key.
+    """
+    return _anthropic_haiku_llm
+
+
+@pytest.fixture(scope="module")
 def mock_openai_response(expected_response_content):
     """Mock OpenAI API response."""
-    mock_response = MagicMock()
-    mock_response.choices = [
-        MagicMock(
-            message=MagicMock(content=expected_response_content),
-            finish_reason="stop",
-        )
-    ]
-    mock_response.usage = MagicMock(prompt_tokens=10, completion_tokens=15, total_tokens=25)
-    mock_response.model = "gpt-4o-mini"
-    mock_response.id = "chatcmpl_test123"
-    return mock_response
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(content=expected_response_content),
+                finish_reason="stop",
+            )
+        ],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=15, total_tokens=25),
+        model="gpt-4o-mini",
+        id="chatcmpl_test123",
+    )
 
 
-@pytest.fixture
-def mock_openai_client(mock_openai_response):
-    """Mock AsyncOpenAI client."""
+@pytest.fixture(scope="module")
+def _openai_client_mock(mock_openai_response):
     mock_client = AsyncMock()
     mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
     return mock_client
 
 
 @pytest.fixture
+def mock_openai_client(_openai_client_mock):
+    """Mock AsyncOpenAI client."""
+    _openai_client_mock.reset_mock()
+    return _openai_client_mock
+
+
+@pytest.fixture(scope="module")
+def openai_llm():
+    """OpenAILLM built once per module.
+
+    Constructing the adapter creates an AsyncOpenAI HTTP client, so unit
+    tests share one instance and swap in a mock client with monkeypatch.
+    """
+    pytest.importorskip("openai")
+    from agenkit.adapters.llm import OpenAILLM
+
+    return OpenAILLM(api_key="test-key")
+
+
+@pytest.fixture(scope="module")
 def mock_gemini_response(expected_response_content):
     """Mock Gemini API response."""
-    mock_response = MagicMock()
-    mock_response.text = expected_response_content
-    mock_response.usage_metadata = MagicMock(
-        prompt_token_count=10, candidates_token_count=15, total_token_count=25
+    return SimpleNamespace(
+        text=expected_response_content,
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=10, candidates_token_count=15, total_token_count=25
+        ),
+        candidates=[SimpleNamespace(finish_reason="STOP")],
     )
-    mock_response.candidates = [MagicMock(finish_reason="STOP")]
-    return mock_response
 
 
-@pytest.fixture
-def mock_gemini_client(mock_gemini_response):
-    """Mock Gemini client."""
+@pytest.fixture(scope="module")
+def _gemini_client_mock(mock_gemini_response):
     mock_client = MagicMock()
     mock_aio = AsyncMock()
     mock_aio.models.generate_content = AsyncMock(return_value=mock_gemini_response)
@@ -168,6 +332,22 @@ def mock_gemini_client(mock_gemini_response):
 
 
 @pytest.fixture
+def mock_gemini_client(_gemini_client_mock):
+    """Mock Gemini client."""
+    _gemini_client_mock.reset_mock()
+    return _gemini_client_mock
+
+
+@pytest.fixture(scope="module")
+def gemini_llm():
+    """GeminiLLM built once per module (constructs a google-genai client)."""
+    pytest.importorskip("google.genai")
+    from agenkit.adapters.llm import GeminiLLM
+
+    return GeminiLLM(api_key="test-key")
+
+
+@pytest.fixture(scope="module")
 def mock_bedrock_response(expected_response_content):
     """Mock Bedrock Converse API response."""
     return {
@@ -179,7 +359,27 @@ def mock_bedrock_response(expected_response_content):
     }
 
 
+@pytest.fixture(scope="module")
+def bedrock_llm():
+    """BedrockLLM built once per module (constructs a boto3 runtime client)."""
+    pytest.importorskip("boto3")
+    from agenkit.adapters.llm import BedrockLLM
+
+    return BedrockLLM(model_id="anthropic.claude-3-haiku-20240307-v1:0")
+
+
 @pytest.fixture
+def bedrock_llm_stubbed(bedrock_llm, mock_bedrock_response, monkeypatch):
+    """bedrock_llm whose converse call returns mock_bedrock_response.
+
+    A plain function stands in for converse; monkeypatch restores the real
+    method after the test.
+    """
+    monkeypatch.setattr(bedrock_llm._client, "converse", lambda **kwargs: mock_bedrock_response)
+    return bedrock_llm
+
+
+@pytest.fixture(scope="module")
 def mock_ollama_response(expected_response_content):
     """Mock Ollama API response."""
     return {
@@ -188,3 +388,114 @@ def mock_ollama_response(expected_response_content):
         "eval_count": 15,
         "total_duration": 1000000000,
     }
+
+
+def _async_returning(value):
+    """Plain async callable returning ``value``, for mocks nobody inspects.
+
+    Cheaper than AsyncMock, which records every call and wraps each await
+    in its mock machinery.
+    """
+
+    async def call(*args, **kwargs):
+        return value
+
+    return call
+
+
+@pytest.fixture(scope="module")
+def mock_ollama_chat(mock_ollama_response):
+    """Stand-in for ollama's AsyncClient.chat."""
+    return _async_returning(mock_ollama_response)
+
+
+@pytest.fixture(scope="module")
+def mock_litellm_acompletion(mock_openai_response):
+    """Stand-in for litellm.acompletion.
+
+    LiteLLM returns OpenAI-shaped responses, so the prebuilt OpenAI one fits.
+    """
+    return _async_returning(mock_openai_response)
+
+
+@pytest.fixture(scope="module")
+def ollama_llm():
+    """OllamaLLM built once per module (constructs an ollama AsyncClient)."""
+    pytest.importorskip("ollama")
+    from agenkit.adapters.llm import OllamaLLM
+
+    return OllamaLLM(model="llama2")
+
+
+@pytest.fixture(scope="module")
+def litellm_llm():
+    """LiteLLMLLM built once per module."""
+    pytest.importorskip("litellm")
+    from agenkit.adapters.llm import LiteLLMLLM
+
+    return LiteLLMLLM(model="gpt-4")
+
+
+# Streaming integration runs
+# Each streaming integration test streams one reply from its own module's
+# provider; the chunks are cached per provider for the rest of the session.
+def _installed(module: str) -> bool:
+    return all(
+        importlib.util.find_spec(".".join(module.split(".")[: i + 1])) is not None
+        for i in range(module.count(".") + 1)
+    )
+
+
+def _streaming_llm(provider: str):
+    """Build the adapter a streaming integration test uses, or None."""
+    from agenkit.adapters import llm
+
+    adapter = None
+    if provider == "anthropic":
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if api_key and _installed("anthropic"):
+            adapter = llm.AnthropicLLM(api_key=api_key, model="claude-3-haiku-20240307")
+    elif provider == "openai":
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key and _installed("openai"):
+            adapter = llm.OpenAILLM(api_key=api_key, model="gpt-4o-mini")
+    elif provider == "gemini":
+        api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        if api_key and _installed("google.genai"):
+            adapter = llm.GeminiLLM(api_key=api_key, model="gemini-2.0-flash-exp")
+    elif provider == "bedrock":
+        if _HAS_AWS_CREDS and _installed("boto3"):
+            adapter = llm.BedrockLLM(
+                model_id="anthropic.claude-3-haiku-20240307-v1:0",
+                profile_name=_AWS_PROFILE,
+                region_name="us-east-1",
+            )
+    elif provider == "ollama":
+        if _installed("ollama") and _ollama_running():
+            adapter = llm.OllamaLLM(model="llama2")
+    elif provider == "litellm":
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key and _installed("litellm"):
+            adapter = llm.LiteLLMLLM(model="gpt-4o-mini", api_key=api_key)
+    return adapter
+
+
+_streamed: dict[str, list[Message]] = {}
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def streamed_chunks(request):
+    """Chunks of one streamed reply from the requesting test's provider.
+
+    The provider comes from the test module name (``test_<provider>.py``),
+    so a worker only streams the provider of the xdist group it runs. Skips
+    when the provider is unavailable (no credentials, SDK or server).
+    """
+    provider = request.path.stem.removeprefix("test_")
+    if provider not in _streamed:
+        llm = _streaming_llm(provider)
+        if llm is None:
+            pytest.skip(f"{provider} not available for streaming")
+        messages = [Message(role="user", content="Hello!")]
+        _streamed[provider] = [chunk async for chunk in llm.stream(messages, max_tokens=50)]
+    return _streamed[provider]
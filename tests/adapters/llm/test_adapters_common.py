@@ -0,0 +1,104 @@
+"""Behavior shared by every LLM adapter, tested once per adapter.
+
+Each case skips when the adapter's SDK is not installed (the adapter
+fixtures in conftest.py call importorskip).
+"""
+
+import pytest
+
+from agenkit.interfaces import Message
+
+# Messages are frozen, so one instance is shared by every case
+AGENT_MESSAGES = (Message(role="agent", content="Hello from agent"),)
+
+# (adapter fixture, role the agent role maps to)
+AGENT_ROLES = [
+    pytest.param("anthropic_llm", "assistant", id="anthropic"),
+    pytest.param("openai_llm", "assistant", id="openai"),
+    pytest.param("gemini_llm", "model", id="gemini"),
+    pytest.param("bedrock_llm", "assistant", id="bedrock"),
+    pytest.param("ollama_llm", "assistant", id="ollama"),
+    pytest.param("litellm_llm", "assistant", id="litellm"),
+]
+
+# (adapter fixture, whether unwrap returns _client)
+UNWRAPS = [
+    pytest.param("anthropic_llm", True, id="anthropic"),
+    pytest.param("openai_llm", True, id="openai"),
+    pytest.param("gemini_llm", True, id="gemini"),
+    pytest.param("bedrock_llm", True, id="bedrock"),
+    pytest.param("ollama_llm", True, id="ollama"),
+    # LiteLLM is a functional API with no client object
+    pytest.param("litellm_llm", False, id="litellm"),
+]
+
+# (SDK module, adapter class, constructor kwargs, expected model)
+MODELS = [
+    pytest.param(
+        "anthropic",
+        "AnthropicLLM",
+        {"api_key": "test-key", "model": "claude-3-opus-20240229"},
+        "claude-3-opus-20240229",
+        id="anthropic",
+    ),
+    pytest.param(
+        "openai", "OpenAILLM", {"api_key": "test-key", "model": "gpt-4"}, "gpt-4", id="openai"
+    ),
+    pytest.param(
+        "google.genai",
+        "GeminiLLM",
+        {"api_key": "test-key", "model": "gemini-pro"},
+        "gemini-pro",
+        id="gemini",
+    ),
+    pytest.param(
+        "boto3",
+        "BedrockLLM",
+        {"model_id": "meta.llama3-70b-instruct-v1:0"},
+        "meta.llama3-70b-instruct-v1:0",
+        id="bedrock",
+    ),
+    pytest.param("ollama", "OllamaLLM", {"model": "mistral"}, "mistral", id="ollama"),
+    pytest.param(
+        "litellm",
+        "LiteLLMLLM",
+        {"model": "claude-3-5-sonnet-20241022"},
+        "claude-3-5-sonnet-20241022",
+        id="litellm",
+    ),
+]
+
+
+@pytest.mark.parametrize("fixture_name,agent_role", AGENT_ROLES)
+def test_message_conversion_agent_role(request, fixture_name, agent_role):
+    """Test agent role is converted to the provider's assistant role."""
+    llm = request.getfixturevalue(fixture_name)
+
+    converted = llm._convert_messages(AGENT_MESSAGES)
+    if isinstance(converted, tuple):
+        # Bedrock returns (messages, system_prompts)
+        converted = converted[0]
+
+    assert converted[0]["role"] == agent_role
+
+
+@pytest.mark.parametrize("fixture_name,unwraps_client", UNWRAPS)
+def test_unwrap(request, fixture_name, unwraps_client):
+    """Test unwrap returns the underlying SDK client."""
+    llm = request.getfixturevalue(fixture_name)
+
+    if unwraps_client:
+        assert llm.unwrap() is llm._client
+    else:
+        assert llm.unwrap() is None
+
+
+@pytest.mark.parametrize("sdk,class_name,kwargs,expected_model", MODELS)
+def test_model_property(sdk, class_name, kwargs, expected_model):
+    """Test model property returns configured model."""
+    pytest.importorskip(sdk)
+    from agenkit.adapters import llm as llm_adapters
+
+    llm = getattr(llm_adapters, class_name)(**kwargs)
+
+    assert llm.model == expected_model
@@ -1,23 +1,26 @@
 """Tests for Anthropic LLM adapter."""
 
-import pytest
-
-from agenkit.interfaces import Message
+import importlib.util
 
-# Skip all tests if anthropic not installed
-pytest.importorskip("anthropic")
+import pytest
 
-from agenkit.adapters.llm import AnthropicLLM
+# Skip all tests if anthropic not installed. find_spec only locates the SDK;
+# it is imported by the tests and fixtures that use it.
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("anthropic") is None, reason="anthropic not installed"
+)
 
 
 # Unit Tests (Mocked)
-@pytest.mark.asyncio
-async def test_complete_success(mock_anthropic_client, simple_test_message):
+# Async tests share one session-scoped event loop instead of one loop per test
+@pytest.mark.asyncio(loop_scope="session")
+async def test_complete_success(
+    anthropic_llm, mock_anthropic_client, simple_test_message, monkeypatch
+):
     """Test successful completion with mocked API."""
-    llm = AnthropicLLM(api_key="test-key")
-    llm._client = mock_anthropic_client
+    monkeypatch.setattr(anthropic_llm, "_client", mock_anthropic_client)
 
-    response = await llm.complete(simple_test_message)
+    response = await anthropic_llm.complete(simple_test_message)
 
     assert response.role == "agent"
     assert response.content == "Hello! I'm doing well, thank you for asking."
@@ -26,13 +29,14 @@ async def test_complete_success(mock_anthropic_client, simple_test_message):
     assert response.metadata["usage"]["output_tokens"] == 15
 
 
-@pytest.mark.asyncio
-async def test_complete_with_options(mock_anthropic_client, simple_test_message):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_complete_with_options(
+    anthropic_llm, mock_anthropic_client, simple_test_message, monkeypatch
+):
     """Test completion with temperature and max_tokens."""
-    llm = AnthropicLLM(api_key="test-key")
-    llm._client = mock_anthropic_client
+    monkeypatch.setattr(anthropic_llm, "_client", mock_anthropic_client)
 
-    await llm.complete(simple_test_message, temperature=0.5, max_tokens=100)
+    await anthropic_llm.complete(simple_test_message, temperature=0.5, max_tokens=100)
 
     # Verify the mock was called with correct parameters
     call_kwargs = mock_anthropic_client.messages.create.call_args.kwargs
@@ -40,23 +44,19 @@ async def test_complete_with_options(mock_anthropic_client, simple_test_message)
     assert call_kwargs["max_tokens"] == 100
 
 
-def test_message_conversion_user(simple_test_message):
+def test_message_conversion_user(anthropic_llm, simple_test_message):
     """Test Agenkit Message to Anthropic format conversion."""
-    llm = AnthropicLLM(api_key="test-key")
-
-    converted = llm._convert_messages(simple_test_message)
+    converted = anthropic_llm._convert_messages(simple_test_message)
 
     assert len(converted) == 1
     assert converted[0]["role"] == "user"
     assert converted[0]["content"] == "Hello!"
 
 
-def test_message_conversion_with_system(test_messages):
+def test_message_conversion_with_system(anthropic_llm, test_messages):
     """Test system message extraction."""
-    llm = AnthropicLLM(api_key="test-key")
-
-    converted = llm._convert_messages(test_messages)
-    system = llm._extract_system_message(test_messages)
+    converted = anthropic_llm._convert_messages(test_messages)
+    system = anthropic_llm._extract_system_message(test_messages)
 
     # System message should be extracted
     assert system == "You are a helpful assistant."
@@ -65,36 +65,12 @@ def test_message_conversion_with_system(test_messages):
     assert converted[0]["role"] == "user"
 
 
-def test_message_conversion_agent_role():
-    """Test agent role is converted to assistant."""
-    llm = AnthropicLLM(api_key="test-key")
-    messages = [Message(role="agent", content="Hello from agent")]
-
-    converted = llm._convert_messages(messages)
-
-    assert converted[0]["role"] == "assistant"
-
-
-def test_model_property():
-    """Test model property returns configured model."""
-    llm = AnthropicLLM(api_key="test-key", model="claude-3-opus-20240229")
-    assert llm.model == "claude-3-opus-20240229"
-
-
-def test_unwrap():
-    """Test unwrap returns underlying client."""
-    llm = AnthropicLLM(api_key="test-key")
-    client = llm.unwrap()
-    # Should return AsyncAnthropic instance
-    assert client is llm._client
-
-
 # Integration Tests (Real API)
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_anthropic_integration(anthropic_api_key, simple_test_message):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_anthropic_integration(anthropic_haiku_llm, simple_test_message):
     """Integration test with real Anthropic API."""
-    llm = AnthropicLLM(api_key=anthropic_api_key, model="claude-3-haiku-20240307")
+    llm = anthropic_haiku_llm
 
     response = await llm.complete(simple_test_message, max_tokens=50)
 
@@ -106,28 +82,23 @@ async def test_anthropic_integration(anthropic_api_key, simple_test_message):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_anthropic_streaming_integration(anthropic_api_key, simple_test_message):
+def test_anthropic_streaming_integration(streamed_chunks):
     """Integration test for streaming with real Anthropic API."""
-    llm = AnthropicLLM(api_key=anthropic_api_key, model="claude-3-haiku-20240307")
+    chunks = streamed_chunks
 
-    chunks = []
-    async for chunk in llm.stream(simple_test_message, max_tokens=50):
+    for chunk in chunks:
         assert chunk.role == "agent"
         assert chunk.metadata["streaming"] is True
-        chunks.append(chunk.content)
 
-    # Should have received multiple chunks
     assert len(chunks) > 0
-    # Combined content should be non-empty
-    assert len("".join(chunks)) > 0
+    assert len("".join(chunk.content for chunk in chunks)) > 0
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_anthropic_with_system_message(anthropic_api_key, test_messages):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_anthropic_with_system_message(anthropic_haiku_llm, test_messages):
     """Test that system messages are handled correctly."""
-    llm = AnthropicLLM(api_key=anthropic_api_key, model="claude-3-haiku-20240307")
+    llm = anthropic_haiku_llm
 
     response = await llm.complete(test_messages, max_tokens=50)
 
@@ -1,25 +1,23 @@
 """Tests for Ollama LLM adapter."""
 
-import pytest
-
-from agenkit.interfaces import Message
+import importlib.util
 
-# Skip all tests if ollama not installed
-pytest.importorskip("ollama")
+import pytest
 
-from agenkit.adapters.llm import OllamaLLM
+# Skip all tests if ollama not installed. find_spec only locates the SDK;
+# it is imported by the tests and fixtures that use it.
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("ollama") is None, reason="ollama not installed"
+)
 
 
 # Unit Tests (Mocked)
 @pytest.mark.asyncio
-async def test_complete_success(mock_ollama_response, simple_test_message):
+async def test_complete_success(ollama_llm, mock_ollama_chat, simple_test_message, monkeypatch):
     """Test successful completion with mocked API."""
-    from unittest.mock import AsyncMock
-
-    llm = OllamaLLM(model="llama2")
-    llm._client.chat = AsyncMock(return_value=mock_ollama_response)
+    monkeypatch.setattr(ollama_llm._client, "chat", mock_ollama_chat)
 
-    response = await llm.complete(simple_test_message)
+    response = await ollama_llm.complete(simple_test_message)
 
     assert response.role == "agent"
     assert response.content == "Hello! I'm doing well, thank you for asking."
@@ -27,11 +25,9 @@ async def test_complete_success(mock_ollama_response, simple_test_message):
     assert response.metadata["eval_count"] == 15
 
 
-def test_message_conversion(test_messages):
+def test_message_conversion(ollama_llm, test_messages):
     """Test Agenkit Message to Ollama format conversion."""
-    llm = OllamaLLM(model="llama2")
-
-    converted = llm._convert_messages(test_messages)
+    converted = ollama_llm._convert_messages(test_messages)
 
     assert len(converted) == 2
     assert converted[0]["role"] == "system"
@@ -39,34 +35,13 @@ def test_message_conversion(test_messages):
     assert converted[1]["role"] == "user"
 
 
-def test_message_conversion_agent_role():
-    """Test agent role is converted to assistant."""
-    llm = OllamaLLM(model="llama2")
-    messages = [Message(role="agent", content="Hello from agent")]
-
-    converted = llm._convert_messages(messages)
-
-    assert converted[0]["role"] == "assistant"
-
-
-def test_model_property():
-    """Test model property returns configured model."""
-    llm = OllamaLLM(model="mistral")
-    assert llm.model == "mistral"
-
-
-def test_unwrap():
-    """Test unwrap returns underlying AsyncClient."""
-    llm = OllamaLLM(model="llama2")
-    client = llm.unwrap()
-    assert client is llm._client
-
-
 # Integration Tests (Real API - requires Ollama running)
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_ollama_integration(ollama_available, simple_test_message):
     """Integration test with local Ollama."""
+    from agenkit.adapters.llm import OllamaLLM
+
     llm = OllamaLLM(model="llama2")
 
     response = await llm.complete(simple_test_message, max_tokens=50)
@@ -77,16 +52,13 @@ async def test_ollama_integration(ollama_available, simple_test_message):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_ollama_streaming_integration(ollama_available, simple_test_message):
+def test_ollama_streaming_integration(streamed_chunks):
     """Integration test for streaming with local Ollama."""
-    llm = OllamaLLM(model="llama2")
+    chunks = streamed_chunks
 
-    chunks = []
-    async for chunk in llm.stream(simple_test_message, max_tokens=50):
+    for chunk in chunks:
         assert chunk.role == "agent"
         assert chunk.metadata["streaming"] is True
-        chunks.append(chunk.content)
 
     assert len(chunks) > 0
-    assert len("".join(chunks)) > 0
+    assert len("".join(chunk.content for chunk in chunks)) > 0
@@ -1,6 +1,8 @@
 """Tests for protocol adapter codec."""
 
-from datetime import datetime
+import math
+from datetime import datetime, timezone
+from uuid import RFC_4122, UUID
 
 import pytest
 
@@ -8,6 +10,7 @@ from agenkit.adapters.python import (
     InvalidMessageError,
     MalformedPayloadError,
     UnsupportedVersionError,
+    codec,
 )
 from agenkit.adapters.python.codec import (
     create_error_envelope,
@@ -23,6 +26,14 @@ from agenkit.adapters.python.codec import (
 )
 from agenkit.interfaces import Message, ToolResult
 
+# Wire form of a message, shared by the decode tests (never mutated)
+DECODE_MESSAGE_DATA = {
+    "role": "agent",
+    "content": "response content",
+    "metadata": {"key": "value"},
+    "timestamp": "2025-11-08T12:34:56.789000+00:00",
+}
+
 
 class TestMessageCodec:
     """Tests for Message encoding/decoding."""
@@ -40,20 +51,21 @@ class TestMessageCodec:
 
     def test_decode_message(self):
         """Test decoding a dict to Message."""
-        data = {
-            "role": "agent",
-            "content": "response content",
-            "metadata": {"key": "value"},
-            "timestamp": "2025-11-08T12:34:56.789000+00:00",
-        }
-
-        msg = decode_message(data)
+        msg = decode_message(DECODE_MESSAGE_DATA)
 
         assert msg.role == "agent"
         assert msg.content == "response content"
         assert msg.metadata == {"key": "value"}
         assert isinstance(msg.timestamp, datetime)
 
+    def test_decode_message_datetime_timestamp(self):
+        """Test an already-parsed datetime timestamp is used as-is."""
+        timestamp = datetime(2025, 11, 8, 12, 34, 56, tzinfo=timezone.utc)
+
+        msg = decode_message({**DECODE_MESSAGE_DATA, "timestamp": timestamp})
+
+        assert msg.timestamp is timestamp
+
     def test_decode_message_missing_timestamp(self):
         """Test decoding message without timestamp uses current time."""
         data = {
@@ -67,6 +79,13 @@ class TestMessageCodec:
         assert msg.role == "user"
         assert isinstance(msg.timestamp, datetime)
 
+    def test_decode_message_interns_role(self):
+        """Test decoded roles are interned so equal roles share one object."""
+        first = decode_message({"role": "".join(["ag", "ent"]), "content": "a"})
+        second = decode_message({"role": "".join(["ag", "ent"]), "content": "b"})
+
+        assert first.role is second.role
+
     def test_decode_message_malformed(self):
         """Test decoding malformed message raises error."""
         data = {"content": "missing role"}
@@ -76,17 +95,6 @@ class TestMessageCodec:
 
         assert "Failed to decode message" in str(exc_info.value)
 
-    def test_roundtrip_message(self):
-        """Test encoding then decoding preserves message."""
-        original = Message(role="user", content="test", metadata={"x": 1})
-
-        encoded = encode_message(original)
-        decoded = decode_message(encoded)
-
-        assert decoded.role == original.role
-        assert decoded.content == original.content
-        assert decoded.metadata == original.metadata
-
 
 class TestToolResultCodec:
     """Tests for ToolResult encoding/decoding."""
@@ -141,17 +149,6 @@ class TestToolResultCodec:
 
         assert "Failed to decode tool result" in str(exc_info.value)
 
-    def test_roundtrip_tool_result(self):
-        """Test encoding then decoding preserves tool result."""
-        original = ToolResult(success=True, data={"x": 1}, metadata={"y": 2})
-
-        encoded = encode_tool_result(original)
-        decoded = decode_tool_result(encoded)
-
-        assert decoded.success == original.success
-        assert decoded.data == original.data
-        assert decoded.metadata == original.metadata
-
 
 class TestEnvelopeCreation:
     """Tests for envelope creation functions."""
@@ -194,6 +191,33 @@ class TestEnvelopeCreation:
         assert envelope["payload"]["error_message"] == "Error message"
         assert envelope["payload"]["error_details"] == {"detail": "value"}
 
+    def test_request_envelope_id_is_uuid4(self):
+        """Test request envelope ids are distinct version 4 UUID strings."""
+        first = create_request_envelope("process")["id"]
+        second = create_request_envelope("process")["id"]
+
+        parsed = UUID(first)
+        assert str(parsed) == first
+        assert parsed.version == 4
+        assert parsed.variant == RFC_4122
+        assert first != second
+
+    def test_envelope_timestamp_reused_within_window(self, monkeypatch):
+        """Test envelopes created within one millisecond share a timestamp."""
+        now_ns = 10**12
+        monkeypatch.setattr(codec.time, "monotonic_ns", lambda: now_ns)
+        monkeypatch.setattr(codec, "_timestamp_cache", (0, ""))
+
+        first = create_response_envelope("req-1", {})["timestamp"]
+        now_ns += codec._TIMESTAMP_WINDOW_NS - 1
+        second = create_response_envelope("req-2", {})["timestamp"]
+        now_ns += 1
+        create_response_envelope("req-3", {})
+
+        assert first
+        assert second is first
+        assert codec._timestamp_cache[0] == now_ns
+
 
 class TestEnvelopeValidation:
     """Tests for envelope validation."""
@@ -222,7 +246,7 @@ class TestEnvelopeValidation:
         with pytest.raises(InvalidMessageError) as exc_info:
             validate_envelope(envelope)
 
-        assert "version" in str(exc_info.value).lower()
+        assert exc_info.value.details["field"] == "version"
 
     def test_validate_unsupported_version(self):
         """Test validating envelope with unsupported version fails."""
@@ -236,7 +260,7 @@ class TestEnvelopeValidation:
         with pytest.raises(UnsupportedVersionError) as exc_info:
             validate_envelope(envelope)
 
-        assert "2.0" in str(exc_info.value)
+        assert exc_info.value.details["version"] == "2.0"
 
     def test_validate_invalid_type(self):
         """Test validating envelope with invalid type fails."""
@@ -250,7 +274,7 @@ class TestEnvelopeValidation:
         with pytest.raises(InvalidMessageError) as exc_info:
             validate_envelope(envelope)
 
-        assert "type" in str(exc_info.value).lower()
+        assert exc_info.value.details["type"] == "invalid_type"
 
     def test_validate_missing_id(self):
         """Test validating envelope without id fails."""
@@ -263,7 +287,7 @@ class TestEnvelopeValidation:
         with pytest.raises(InvalidMessageError) as exc_info:
             validate_envelope(envelope)
 
-        assert "id" in str(exc_info.value).lower()
+        assert exc_info.value.details["field"] == "id"
 
     def test_validate_missing_payload(self):
         """Test validating envelope without payload fails."""
@@ -276,23 +300,54 @@ class TestEnvelopeValidation:
         with pytest.raises(InvalidMessageError) as exc_info:
             validate_envelope(envelope)
 
-        assert "payload" in str(exc_info.value).lower()
+        assert exc_info.value.details["field"] == "payload"
+
+    def test_validate_missing_several_fields(self):
+        """Test the first missing field in envelope order is reported."""
+        envelope = {"version": "1.0", "payload": {}}
+
+        with pytest.raises(InvalidMessageError) as exc_info:
+            validate_envelope(envelope)
+
+        assert exc_info.value.details["field"] == "type"
 
+    @pytest.mark.parametrize("envelope", [[1, 2], "abc", 42, None])
+    def test_validate_non_object_envelope(self, envelope):
+        """Test validating a JSON array or scalar fails."""
+        with pytest.raises(InvalidMessageError):
+            validate_envelope(envelope)
 
+
+@pytest.fixture(params=["json", "orjson"])
+def codec_backend(request, monkeypatch):
+    """Run a test against both the stdlib json and the orjson code paths."""
+    if request.param == "json":
+        monkeypatch.setattr(codec, "orjson", None)
+    elif codec.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def sample_request_envelope():
+    """Request envelope shared by tests that only read it."""
+    return create_request_envelope("process", "agent", {"key": "value"})
+
+
+@pytest.mark.usefixtures("codec_backend")
 class TestBytesCodec:
     """Tests for bytes encoding/decoding."""
 
-    def test_encode_bytes(self):
+    def test_encode_bytes(self, sample_request_envelope):
         """Test encoding envelope to bytes."""
-        envelope = create_request_envelope("process")
-        encoded = encode_bytes(envelope)
+        encoded = encode_bytes(sample_request_envelope)
 
         assert isinstance(encoded, bytes)
         assert len(encoded) > 0
 
-    def test_decode_bytes(self):
+    def test_decode_bytes(self, sample_request_envelope):
         """Test decoding bytes to envelope."""
-        envelope = create_request_envelope("process")
+        envelope = sample_request_envelope
         encoded = encode_bytes(envelope)
         decoded = decode_bytes(encoded)
 
@@ -316,17 +371,72 @@ class TestBytesCodec:
         with pytest.raises(MalformedPayloadError) as exc_info:
             decode_bytes(invalid_utf8)
 
-        assert "UTF-8" in str(exc_info.value)
-
-    def test_roundtrip_bytes(self):
-        """Test encoding then decoding preserves envelope."""
-        original = create_request_envelope("process", "agent", {"key": "value"})
-        encoded = encode_bytes(original)
-        decoded = decode_bytes(encoded)
-
-        assert decoded["version"] == original["version"]
-        assert decoded["type"] == original["type"]
-        assert decoded["payload"] == original["payload"]
+        assert "Failed to decode UTF-8" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "value", [2**70, -(2**70), 2**63, float("inf"), float("-inf")], ids=repr
+    )
+    def test_roundtrip_exact_numbers(self, value):
+        """Test big integers and infinities survive an encode/decode round trip."""
+        envelope = create_response_envelope("req-1", {"n": value})
+
+        decoded = decode_bytes(encode_bytes(envelope))
+
+        assert decoded["payload"]["n"] == value
+        assert type(decoded["payload"]["n"]) is type(value)
+
+    def test_roundtrip_nan(self):
+        """Test NaN survives an encode/decode round trip instead of becoming None."""
+        envelope = create_response_envelope("req-1", {"n": float("nan"), "none": None})
+
+        decoded = decode_bytes(encode_bytes(envelope))
+
+        assert math.isnan(decoded["payload"]["n"])
+        assert decoded["payload"]["none"] is None
+
+    @pytest.mark.parametrize("data", [b"[1,2]", b'"abc"', b"42", b"null"])
+    def test_decode_non_object_json(self, data):
+        """Test decoding valid JSON that is not an object raises error."""
+        with pytest.raises(InvalidMessageError):
+            decode_bytes(data)
+
+
+class TestRoundtrip:
+    """Tests that decoding an encoded value preserves its fields."""
+
+    @pytest.mark.parametrize(
+        "encode,decode,make,fields",
+        [
+            pytest.param(
+                encode_message,
+                decode_message,
+                lambda: Message(role="user", content="test", metadata={"x": 1}),
+                lambda m: (m.role, m.content, m.metadata),
+                id="message",
+            ),
+            pytest.param(
+                encode_tool_result,
+                decode_tool_result,
+                lambda: ToolResult(success=True, data={"x": 1}, metadata={"y": 2}),
+                lambda r: (r.success, r.data, r.metadata),
+                id="tool_result",
+            ),
+            pytest.param(
+                encode_bytes,
+                decode_bytes,
+                lambda: create_request_envelope("process", "agent", {"key": "value"}),
+                lambda e: (e["version"], e["type"], e["payload"]),
+                id="bytes",
+            ),
+        ],
+    )
+    def test_roundtrip(self, encode, decode, make, fields):
+        """Test encoding then decoding preserves the value."""
+        original = make()
+
+        decoded = decode(encode(original))
+
+        assert fields(decoded) == fields(original)
 
 
 class TestStreamEnvelopes:
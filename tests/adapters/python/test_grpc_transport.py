@@ -14,7 +14,7 @@ from agenkit.adapters.python.errors import (
     InvalidMessageError,
     MalformedPayloadError,
 )
-from agenkit.adapters.python.grpc_transport import GRPCTransport
+from agenkit.adapters.python.grpc_transport import UNAVAILABLE_RETRY_POLICY, GRPCTransport
 from proto import agent_pb2
 
 
@@ -57,8 +57,50 @@ class TestGRPCTransportConnection:
             await transport.connect()
 
             assert transport.is_connected
+            mock_channel.assert_called_once()
+            assert mock_channel.call_args.args == ("localhost:50051",)
+
+    @pytest.mark.asyncio
+    async def test_connect_configures_retry_policy(self):
+        """Test that a retry policy is passed as channel service config."""
+        transport = GRPCTransport("grpc://localhost:50051", retry_policy=UNAVAILABLE_RETRY_POLICY)
+
+        with patch("agenkit.adapters.python.grpc_transport.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            await transport.connect()
+
+            options = dict(mock_channel.call_args.kwargs["options"])
+            service_config = json.loads(options["grpc.service_config"])
+            retry_policy = service_config["methodConfig"][0]["retryPolicy"]
+            assert retry_policy["maxAttempts"] == 3
+            assert retry_policy["retryableStatusCodes"] == ["UNAVAILABLE"]
+
+    @pytest.mark.asyncio
+    async def test_connect_without_retry_policy(self):
+        """Test that channel retries are off by default."""
+        transport = GRPCTransport("grpc://localhost:50051")
+
+        with patch("agenkit.adapters.python.grpc_transport.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            await transport.connect()
+
             mock_channel.assert_called_once_with("localhost:50051")
 
+    @pytest.mark.asyncio
+    async def test_retry_policy_is_copied(self):
+        """Test that later changes to the caller's policy do not affect the transport."""
+        policy = dict(UNAVAILABLE_RETRY_POLICY)
+        transport = GRPCTransport("grpc://localhost:50051", retry_policy=policy)
+        policy["maxAttempts"] = 99
+
+        with patch("agenkit.adapters.python.grpc_transport.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            await transport.connect()
+
+            options = dict(mock_channel.call_args.kwargs["options"])
+            service_config = json.loads(options["grpc.service_config"])
+            assert service_config["methodConfig"][0]["retryPolicy"]["maxAttempts"] == 3
+
     @pytest.mark.asyncio
     async def test_connect_already_connected(self):
         """Test connecting when already connected."""
@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import struct
 import tempfile
 from pathlib import Path
 
@@ -10,9 +11,18 @@ import pytest
 from agenkit.adapters.python import (
     AgentTimeoutError,
     ConnectionError,
+    InvalidMessageError,
     LocalAgent,
     RemoteAgent,
+    RemoteExecutionError,
 )
+from agenkit.adapters.python.codec import (
+    create_response_envelope,
+    decode_bytes,
+    encode_bytes,
+    encode_message,
+)
+from agenkit.adapters.python.transport import Transport
 from agenkit.interfaces import Agent, Message
 
 
@@ -53,6 +63,78 @@ class ErrorAgent(Agent):
         raise ValueError("Intentional error for testing")
 
 
+class ReorderingTransport(Transport):
+    """Pipelining transport whose server answers a batch in reverse order.
+
+    Framing comes from the Transport base class; the fake server buffers
+    requests until ``batch_size`` have arrived and then answers them all.
+    """
+
+    supports_pipelining = True
+
+    def __init__(self, batch_size: int, drop_last: bool = False):
+        self._batch_size = batch_size
+        self._drop_last = drop_last
+        self._inbound = bytearray()
+        self._outbound = bytearray()
+        self._requests: list[dict] = []
+        self._ready = asyncio.Condition()
+
+    async def connect(self) -> None:
+        pass
+
+    async def send(self, data: bytes) -> None:
+        self._inbound.extend(data)
+        while len(self._inbound) >= 4:
+            length = struct.unpack(">I", self._inbound[:4])[0]
+            if len(self._inbound) < 4 + length:
+                break
+            self._requests.append(decode_bytes(bytes(self._inbound[4 : 4 + length])))
+            del self._inbound[: 4 + length]
+
+        if len(self._requests) == self._batch_size:
+            answered = self._requests[:-1] if self._drop_last else self._requests
+            for request in reversed(answered):
+                content = request["payload"]["message"]["content"]
+                reply = Message(role="agent", content=f"Echo: {content}")
+                envelope = create_response_envelope(
+                    request["id"], {"message": encode_message(reply)}
+                )
+                self._outbound.extend(self._frame(encode_bytes(envelope)))
+            if self._drop_last:
+                # Answer with a stray id in place of the dropped request
+                stray = create_response_envelope("unknown", {"message": {}})
+                self._outbound.extend(self._frame(encode_bytes(stray)))
+            self._requests.clear()
+            async with self._ready:
+                self._ready.notify_all()
+
+    async def receive(self) -> bytes:
+        async with self._ready:
+            await self._ready.wait_for(lambda: bool(self._outbound))
+        data = bytes(self._outbound)
+        self._outbound.clear()
+        return data
+
+    async def receive_exactly(self, n: int) -> bytes:
+        async with self._ready:
+            await self._ready.wait_for(lambda: len(self._outbound) >= n)
+        data = bytes(self._outbound[:n])
+        del self._outbound[:n]
+        return data
+
+    async def close(self) -> None:
+        pass
+
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    @staticmethod
+    def _frame(data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + data
+
+
 @pytest.mark.asyncio
 class TestRemoteAgentCommunication:
     """Tests for remote agent communication."""
@@ -132,6 +214,112 @@ class TestRemoteAgentCommunication:
             finally:
                 await server.stop()
 
+    async def test_process_many_pipelined(self):
+        """Test pipelined batch requests return responses in order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = Path(tmpdir) / "test.sock"
+            endpoint = f"unix://{socket_path}"
+
+            echo_agent = EchoAgent()
+            server = LocalAgent(echo_agent, endpoint=endpoint)
+            await server.start()
+
+            try:
+                remote = RemoteAgent("echo", endpoint=endpoint)
+
+                messages = [Message(role="user", content=f"Message {i}") for i in range(10)]
+                responses = await remote.process_many(messages)
+
+                assert [r.content for r in responses] == [f"Echo: Message {i}" for i in range(10)]
+
+                # Connection is still usable for regular requests afterwards
+                response = await remote.process(Message(role="user", content="After"))
+                assert response.content == "Echo: After"
+            finally:
+                await server.stop()
+
+    async def test_process_many_large_batch(self):
+        """Test a batch larger than the socket buffers completes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = Path(tmpdir) / "test.sock"
+            endpoint = f"unix://{socket_path}"
+
+            server = LocalAgent(EchoAgent(), endpoint=endpoint)
+            await server.start()
+
+            try:
+                remote = RemoteAgent("echo", endpoint=endpoint, timeout=10.0)
+
+                payload = "x" * 100_000
+                messages = [Message(role="user", content=f"{i}:{payload}") for i in range(200)]
+                responses = await asyncio.wait_for(remote.process_many(messages), timeout=30.0)
+
+                assert [r.content for r in responses] == [
+                    f"Echo: {i}:{payload}" for i in range(200)
+                ]
+                await remote.close()
+            finally:
+                await server.stop()
+
+    async def test_process_many_timeout_reconnects(self):
+        """Test a timed-out batch drops the connection so later calls get fresh responses."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = Path(tmpdir) / "test.sock"
+            endpoint = f"unix://{socket_path}"
+
+            server = LocalAgent(SlowAgent(delay=0.3), endpoint=endpoint)
+            await server.start()
+
+            try:
+                remote = RemoteAgent("slow", endpoint=endpoint, timeout=0.1)
+
+                messages = [Message(role="user", content=f"Message {i}") for i in range(3)]
+                with pytest.raises(AgentTimeoutError):
+                    await remote.process_many(messages)
+
+                # A stale response from the aborted batch must not answer this request
+                remote._timeout = 5.0
+                response = await remote.process(Message(role="user", content="After"))
+                assert response.content == "Slow response: After"
+                await remote.close()
+            finally:
+                await server.stop()
+
+    async def test_process_many_error(self):
+        """Test that an error response in a batch is raised."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = Path(tmpdir) / "test.sock"
+            endpoint = f"unix://{socket_path}"
+
+            server = LocalAgent(ErrorAgent(), endpoint=endpoint)
+            await server.start()
+
+            try:
+                remote = RemoteAgent("error", endpoint=endpoint)
+
+                messages = [Message(role="user", content=f"Message {i}") for i in range(3)]
+                with pytest.raises(RemoteExecutionError):
+                    await remote.process_many(messages)
+            finally:
+                await server.stop()
+
+    async def test_process_many_matches_responses_by_id(self):
+        """Test pipelined responses are matched to requests by envelope id."""
+        remote = RemoteAgent("echo", transport=ReorderingTransport(batch_size=5))
+
+        messages = [Message(role="user", content=f"Message {i}") for i in range(5)]
+        responses = await remote.process_many(messages)
+
+        assert [r.content for r in responses] == [f"Echo: Message {i}" for i in range(5)]
+
+    async def test_process_many_missing_response(self):
+        """Test a batch whose responses do not cover every request fails."""
+        remote = RemoteAgent("echo", transport=ReorderingTransport(batch_size=3, drop_last=True))
+
+        messages = [Message(role="user", content=f"Message {i}") for i in range(3)]
+        with pytest.raises(InvalidMessageError):
+            await remote.process_many(messages)
+
     async def test_remote_agent_timeout(self):
         """Test remote agent timeout handling."""
         with tempfile.TemporaryDirectory() as tmpdir:
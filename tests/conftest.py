@@ -0,0 +1,32 @@
+"""Shared pytest configuration for the agenkit test suite."""
+
+from pathlib import Path
+
+import pytest
+
+# Integration tests here call real provider APIs and need credentials
+_LLM_TESTS = Path(__file__).parent / "adapters" / "llm"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run LLM adapter tests marked integration (real provider APIs)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip LLM adapter integration tests unless --run-integration is given.
+
+    Integration tests elsewhere (e.g. the local transport suites under
+    tests/integration) need no credentials and always run.
+    """
+    if config.getoption("--run-integration"):
+        return
+
+    skip_integration = pytest.mark.skip(reason="need --run-integration option to run")
+    for item in items:
+        if "integration" in item.keywords and _LLM_TESTS in item.path.parents:
+            item.add_marker(skip_integration)